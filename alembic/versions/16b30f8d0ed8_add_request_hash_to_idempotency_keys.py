@@ -0,0 +1,28 @@
+"""Add request hash to idempotency keys
+
+Revision ID: 16b30f8d0ed8
+Revises: b1a9e6be0b2e
+Create Date: 2026-10-15 23:40:27.372829
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '16b30f8d0ed8'
+down_revision: Union[str, None] = 'b1a9e6be0b2e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('idempotency_keys') as batch_op:
+        batch_op.add_column(sa.Column('request_hash', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('idempotency_keys') as batch_op:
+        batch_op.drop_column('request_hash')
@@ -0,0 +1,28 @@
+"""Use server default for transaction created_at
+
+Revision ID: 542a8f1d1155
+Revises: b24784e562fc
+Create Date: 2026-10-15 22:58:55.979736
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '542a8f1d1155'
+down_revision: Union[str, None] = 'b24784e562fc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('transactions') as batch_op:
+        batch_op.alter_column('created_at', existing_type=sa.DateTime(), existing_nullable=False, server_default=sa.func.now())
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('transactions') as batch_op:
+        batch_op.alter_column('created_at', existing_type=sa.DateTime(), existing_nullable=False, server_default=None)
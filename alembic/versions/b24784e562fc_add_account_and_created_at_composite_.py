@@ -0,0 +1,28 @@
+"""Add account and created_at composite indexes to transactions
+
+Revision ID: b24784e562fc
+Revises: 7c99189c3a29
+Create Date: 2026-10-15 22:58:00.178555
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b24784e562fc'
+down_revision: Union[str, None] = '7c99189c3a29'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_transactions_from_account_created_at', 'transactions', ['from_account', 'created_at'], unique=False)
+    op.create_index('ix_transactions_to_account_created_at', 'transactions', ['to_account', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_transactions_to_account_created_at', table_name='transactions')
+    op.drop_index('ix_transactions_from_account_created_at', table_name='transactions')
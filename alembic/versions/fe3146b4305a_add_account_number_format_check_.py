@@ -0,0 +1,31 @@
+"""Add account number format check constraint
+
+Revision ID: fe3146b4305a
+Revises: 542a8f1d1155
+Create Date: 2026-10-15 23:03:36.539827
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'fe3146b4305a'
+down_revision: Union[str, None] = '542a8f1d1155'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.create_check_constraint(
+            'ck_user_account_number_format',
+            "length(account_number) BETWEEN 8 AND 12 AND account_number NOT LIKE '0%'"
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.drop_constraint('ck_user_account_number_format', type_='check')
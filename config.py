@@ -10,6 +10,7 @@ class Settings(BaseSettings):
     secret_key: str = "bric-pay-secret-key-change-in-production"
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
+    bcrypt_rounds: int = 12  # Work factor; each +1 doubles hashing cost
     
     # Application Settings
     debug: bool = True
@@ -27,6 +28,7 @@ class Settings(BaseSettings):
     db_pool_size: int = 10
     db_max_overflow: int = 20
     db_pool_timeout: int = 30
+    db_pool_recycle: int = 1800  # Seconds before a pooled connection is replaced
     
     class Config:
         env_file = ".env"
@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
 from config import settings
@@ -6,6 +6,17 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Applied to every new SQLite connection: WAL lets readers run alongside a writer,
+# and synchronous=NORMAL needs one fsync per commit instead of two in WAL mode
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA busy_timeout=5000",
+)
+
 # Create database engine
 if "sqlite" in settings.database_url:
     engine = create_engine(
@@ -14,12 +25,26 @@ if "sqlite" in settings.database_url:
         poolclass=StaticPool,
         echo=settings.debug  # Log SQL queries in debug mode
     )
+    
+    # In-memory databases have no journal file, so WAL does not apply to them
+    if engine.url.database in (None, "", ":memory:"):
+        SQLITE_PRAGMAS = tuple(p for p in SQLITE_PRAGMAS if not p.startswith("PRAGMA journal_mode"))
+    
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Configure journaling and caching for each new SQLite connection"""
+        cursor = dbapi_connection.cursor()
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
 else:
     engine = create_engine(
         settings.database_url,
         pool_size=settings.db_pool_size,
         max_overflow=settings.db_max_overflow,
         pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=True,  # Validate connections on checkout instead of per request
         echo=settings.debug  # Log SQL queries in debug mode
     )
 
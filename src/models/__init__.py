@@ -2,5 +2,6 @@
 from .base import Base, BaseModel
 from .user import User
 from .transaction import Transaction, TransactionType
+from .idempotency_key import IdempotencyKey
 
-__all__ = ['Base', 'BaseModel', 'User', 'Transaction', 'TransactionType'] 
\ No newline at end of file
+__all__ = ['Base', 'BaseModel', 'User', 'Transaction', 'TransactionType', 'IdempotencyKey'] 
\ No newline at end of file
@@ -0,0 +1,22 @@
+from sqlalchemy import Column, String, Text, DateTime
+from sqlalchemy.sql import func
+from .base import Base
+
+class IdempotencyKey(Base):
+    """Stored results of non-idempotent operations, keyed by client-supplied idempotency key"""
+    __tablename__ = "idempotency_keys"
+
+    # Client-supplied key; the primary key guarantees a key is recorded at most once
+    key = Column(String(255), primary_key=True)
+
+    # Serialized result of the operation, replayed for repeated requests
+    response = Column(Text, nullable=False)
+    
+    # SHA-256 fingerprint of the request; a key reused for a different request is rejected
+    request_hash = Column(String(64), nullable=True)
+
+    # Timestamps (indexed for expiry purges)
+    created_at = Column(DateTime, nullable=False, server_default=func.now(), index=True)
+
+    def __repr__(self):
+        return f"<IdempotencyKey(key='{self.key}', created_at={self.created_at})>"
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Numeric, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, DateTime, Numeric, ForeignKey, Enum, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 import enum
@@ -25,12 +25,18 @@ class Transaction(Base):
     transaction_type = Column(Enum(TransactionType), nullable=False)
     
     # Timestamps
-    created_at = Column(DateTime, nullable=False, default=func.now())
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
     
     # Relationships
     from_user = relationship("User", foreign_keys=[from_account], backref="sent_transactions")
     to_user = relationship("User", foreign_keys=[to_account], backref="received_transactions")
     
+    # Indexes
+    __table_args__ = (
+        Index('ix_transactions_from_account_created_at', 'from_account', 'created_at'),
+        Index('ix_transactions_to_account_created_at', 'to_account', 'created_at'),
+    )
+    
     def __repr__(self):
         return f"<Transaction(id={self.id}, from='{self.from_account}', to='{self.to_account}', amount={self.amount})>"
     
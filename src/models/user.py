@@ -1,6 +1,7 @@
-from sqlalchemy import Column, Integer, String, DateTime, Numeric, UniqueConstraint
+from sqlalchemy import Column, Integer, String, DateTime, Numeric, UniqueConstraint, CheckConstraint
 from sqlalchemy.sql import func
 from datetime import datetime
+from decimal import Decimal
 from .base import Base
 
 class User(Base):
@@ -32,6 +33,10 @@ class User(Base):
     __table_args__ = (
         UniqueConstraint('phone', name='uq_user_phone'),
         UniqueConstraint('account_number', name='uq_user_account_number'),
+        CheckConstraint(
+            "length(account_number) BETWEEN 8 AND 12 AND account_number NOT LIKE '0%'",
+            name='ck_user_account_number_format'
+        ),
     )
     
     def __repr__(self):
@@ -54,6 +59,5 @@ class User(Base):
     
     def update_balance(self, amount: float):
         """Update balance with proper type conversion"""
-        from decimal import Decimal
         current_balance = float(self.balance) if self.balance else 0.0
         self.balance = Decimal(str(current_balance + amount)) 
\ No newline at end of file
@@ -8,11 +8,14 @@ from src.services.account_service import AccountService
 from src.utils import (
     validate_account_number, 
     get_account_number_analysis,
+    is_account_number_unique,
+    generate_account_number,
     handle_validation_error,
     handle_business_logic_error,
     handle_generic_error,
     sanitize_input,
-    BusinessLogicError
+    BusinessLogicError,
+    SecurityError
 )
 
 logger = logging.getLogger(__name__)
@@ -20,6 +23,9 @@ logger = logging.getLogger(__name__)
 # Create blueprint
 account_bp = Blueprint('account', __name__, url_prefix='/api/v1')
 
+# Maximum number of account numbers accepted by the batch validation endpoint
+MAX_BATCH_SIZE = 100
+
 @account_bp.route('/create-account', methods=['POST'])
 def create_account():
     """
@@ -134,6 +140,67 @@ def validate_account_number_endpoint():
     except Exception as e:
         return handle_generic_error(e, "account number validation")
 
+@account_bp.route('/batch-validate-account-numbers', methods=['POST'])
+def batch_validate_account_numbers_endpoint():
+    """
+    Validate the format of several account numbers in one request
+    
+    Expected JSON payload:
+    {
+        "account_numbers": ["1234567890", "9876543210"]
+    }
+    
+    Returns:
+        JSON response with one is_valid flag per account number, in request order.
+        Empty, non-string or unsanitizable entries are reported as invalid.
+    """
+    try:
+        # Get JSON data from request
+        data = request.get_json()
+        if not data:
+            raise BusinessLogicError(
+                "Request body is required",
+                code="MISSING_REQUEST_BODY"
+            )
+        
+        account_numbers = data.get('account_numbers')
+        if not isinstance(account_numbers, list):
+            raise BusinessLogicError(
+                "account_numbers must be a list",
+                code="MISSING_FIELD",
+                field="account_numbers"
+            )
+        
+        if len(account_numbers) > MAX_BATCH_SIZE:
+            raise BusinessLogicError(
+                f"At most {MAX_BATCH_SIZE} account numbers can be validated per request",
+                code="BATCH_TOO_LARGE",
+                field="account_numbers"
+            )
+        
+        results = []
+        for account_number in account_numbers:
+            if not account_number or not isinstance(account_number, str):
+                results.append(False)
+                continue
+            try:
+                results.append(validate_account_number(sanitize_input(account_number, max_length=20)))
+            except SecurityError:
+                results.append(False)
+        
+        return jsonify({
+            'results': results,
+            'total': len(results),
+            'valid_count': sum(results),
+            'message': 'Batch account number validation completed'
+        }), 200
+        
+    except BusinessLogicError as e:
+        return handle_business_logic_error(e)
+        
+    except Exception as e:
+        return handle_generic_error(e, "batch account number validation")
+
 @account_bp.route('/analyze-account-number', methods=['POST'])
 def analyze_account_number_endpoint():
     """
@@ -175,7 +242,6 @@ def analyze_account_number_endpoint():
         analysis = get_account_number_analysis(sanitized_account)
         
         # Add uniqueness check
-        from src.utils import is_account_number_unique
         analysis['is_unique_in_db'] = is_account_number_unique(db, sanitized_account)
         
         return jsonify({
@@ -213,7 +279,6 @@ def generate_account_number_endpoint():
         db = next(get_db())
         
         # Generate account number
-        from src.utils import generate_account_number
         account_number = generate_account_number(db, length)
         
         return jsonify({
@@ -29,6 +29,9 @@ def deposit_funds():
         "amount": 100.50
     }
     
+    An optional Idempotency-Key header makes the request safe to retry: a
+    repeated key returns the original result without depositing again.
+    
     Returns:
         JSON response with updated balance and success message
     """
@@ -42,8 +45,20 @@ def deposit_funds():
         except ValidationError as e:
             return handle_validation_error(e)
         
+        # Optional client-supplied key that makes retries of this deposit safe
+        idempotency_key = request.headers.get('Idempotency-Key')
+        if idempotency_key:
+            try:
+                idempotency_key = sanitize_input(idempotency_key, max_length=255)
+            except Exception as e:
+                raise BusinessLogicError(
+                    str(e),
+                    code="INVALID_IDEMPOTENCY_KEY",
+                    field="Idempotency-Key"
+                )
+        
         # Process deposit
-        result = DepositService.deposit_funds(db, deposit_data)
+        result = DepositService.deposit_funds(db, deposit_data, idempotency_key=idempotency_key)
         
         logger.info(f"Deposit successful for account {deposit_data.account_number}")
         return jsonify(result.dict()), 200
@@ -24,6 +24,9 @@ transfer_bp = Blueprint('transfer', __name__, url_prefix='/api/v1')
 def transfer_funds():
     """
     Transfer funds between accounts
+    
+    An optional Idempotency-Key header makes the request safe to retry: a
+    repeated key returns the original result without transferring again.
     """
     try:
         # Get JSON data from request
@@ -41,11 +44,23 @@ def transfer_funds():
         except ValidationError as e:
             return handle_validation_error(e)
         
+        # Optional client-supplied key that makes retries of this transfer safe
+        idempotency_key = request.headers.get('Idempotency-Key')
+        if idempotency_key:
+            try:
+                idempotency_key = sanitize_input(idempotency_key, max_length=255)
+            except Exception as e:
+                raise BusinessLogicError(
+                    str(e),
+                    code="INVALID_IDEMPOTENCY_KEY",
+                    field="Idempotency-Key"
+                )
+        
         # Get database session
         db = next(get_db())
         
         # Perform transfer
-        result = TransferService.transfer_funds(db, transfer_data)
+        result = TransferService.transfer_funds(db, transfer_data, idempotency_key=idempotency_key)
         
         return jsonify(result.dict()), 200
         
@@ -1,12 +1,16 @@
 from flask import Blueprint, request, jsonify
 from pydantic import ValidationError
 import logging
+import re
 
 from src.database import get_db
 from src.schemas import ValidationRequest, ValidationResponse, ErrorResponse
 from src.utils import (
     validate_phone_number,
     validate_password_strength,
+    validate_account_number,
+    get_account_number_analysis,
+    is_account_number_unique,
     sanitize_input,
     handle_validation_error,
     handle_generic_error,
@@ -18,6 +22,9 @@ logger = logging.getLogger(__name__)
 # Create blueprint
 validation_bp = Blueprint('validation', __name__, url_prefix='/api/v1')
 
+# Basic name format used by field validation
+NAME_RE = re.compile(r'^[a-zA-Z\s\'-]{2,100}$')
+
 @validation_bp.route('/validate-field', methods=['POST'])
 def validate_field():
     """
@@ -77,7 +84,6 @@ def validate_field():
             }
             
         elif field_name.lower() in ['account_number', 'account']:
-            from src.utils import validate_account_number
             is_valid = validate_account_number(sanitized_value)
             message = "Account number format is valid" if is_valid else "Account number format is invalid"
             details = {
@@ -87,8 +93,7 @@ def validate_field():
             
         elif field_name.lower() in ['name', 'surname', 'first_name', 'last_name']:
             # Basic name validation
-            import re
-            is_valid = bool(re.match(r'^[a-zA-Z\s\'-]{2,100}$', sanitized_value))
+            is_valid = bool(NAME_RE.match(sanitized_value))
             message = "Name format is valid" if is_valid else "Name format is invalid"
             details = {
                 "type": "name_validation",
@@ -257,13 +262,11 @@ def validate_account():
                 details=str(e)
             ).dict()), 400
         
-        from src.utils import validate_account_number, get_account_number_analysis
         is_valid = validate_account_number(sanitized_account)
         analysis = get_account_number_analysis(sanitized_account)
         
         # Check uniqueness in database
         db = next(get_db())
-        from src.utils import is_account_number_unique
         is_unique = is_account_number_unique(db, sanitized_account)
         
         return jsonify({
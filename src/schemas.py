@@ -3,6 +3,8 @@ from datetime import datetime
 from typing import Optional
 import re
 
+from src.utils.password_strength import COMMON_PASSWORD_RE, SEQUENTIAL_DIGITS_RE, scan_character_classes
+
 class CreateAccountRequest(BaseModel):
     """Schema for account creation request"""
     name: str = Field(..., min_length=1, max_length=100, description="User's first name")
@@ -61,30 +63,25 @@ class CreateAccountRequest(BaseModel):
             raise ValueError('Password must be at least 8 characters long')
         
         # Check for at least one uppercase letter, one lowercase letter, and one digit
-        if not re.search(r'[A-Z]', v):
+        has_lowercase, has_uppercase, has_digit, has_special = scan_character_classes(v)
+        if not has_uppercase:
             raise ValueError('Password must contain at least one uppercase letter')
-        if not re.search(r'[a-z]', v):
+        if not has_lowercase:
             raise ValueError('Password must contain at least one lowercase letter')
-        if not re.search(r'\d', v):
+        if not has_digit:
             raise ValueError('Password must contain at least one digit')
         
         # Check for special characters
-        if not re.search(r'[!@#$%^&*(),.?":{}|<>]', v):
+        if not has_special:
             raise ValueError('Password must contain at least one special character')
         
         # Check for common weak patterns
-        common_patterns = [
-            'password', '123456', 'qwerty', 'admin', 'user',
-            'letmein', 'welcome', 'monkey', 'dragon', 'master'
-        ]
-        
-        password_lower = v.lower()
-        for pattern in common_patterns:
-            if pattern in password_lower:
-                raise ValueError(f'Password cannot contain common patterns like "{pattern}"')
+        common_match = COMMON_PASSWORD_RE.search(v)
+        if common_match:
+            raise ValueError(f'Password cannot contain common patterns like "{common_match.group(0).lower()}"')
         
         # Check for sequential characters
-        if re.search(r'(?:123|234|345|456|567|678|789|890|012)', v):
+        if SEQUENTIAL_DIGITS_RE.search(v):
             raise ValueError('Password cannot contain sequential numbers')
         
         return v
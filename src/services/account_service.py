@@ -6,7 +6,7 @@ import logging
 from src.models import User
 from src.schemas import CreateAccountRequest, CreateAccountResponse
 from src.utils.auth import hash_password
-from src.utils.account import generate_account_number
+from src.utils.account import AccountNumberGenerator
 
 logger = logging.getLogger(__name__)
 
@@ -38,28 +38,20 @@ class AccountService:
             # Hash the password
             hashed_password = hash_password(account_data.password)
             
-            # Generate unique account number
-            account_number = generate_account_number(db)
-            
             # Parse date of birth
             date_of_birth = datetime.strptime(account_data.date_of_birth, '%Y-%m-%d')
             
-            # Create new user
-            new_user = User(
-                name=account_data.name,
-                surname=account_data.surname,
-                phone=account_data.phone,
-                password_hash=hashed_password,
-                date_of_birth=date_of_birth,
-                place_of_birth=account_data.place_of_birth,
-                account_number=account_number,
-                balance=0.00  # Initial balance is 0
-            )
-            
-            # Add to database
-            db.add(new_user)
+            # Insert new user; the database enforces account number uniqueness
+            account_number = AccountNumberGenerator.generate_and_insert(db, {
+                'name': account_data.name,
+                'surname': account_data.surname,
+                'phone': account_data.phone,
+                'password_hash': hashed_password,
+                'date_of_birth': date_of_birth,
+                'place_of_birth': account_data.place_of_birth,
+                'balance': 0.00  # Initial balance is 0
+            })
             db.commit()
-            db.refresh(new_user)
             
             logger.info(f"Created new account: {account_number} for user {account_data.name} {account_data.surname}")
             
@@ -1,12 +1,12 @@
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError, OperationalError
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 import threading
 
 from src.models import User, Transaction, TransactionType
 from src.schemas import DepositRequest, DepositResponse
-from src.utils import TransactionManager, atomic_operation, with_connection_retry
+from src.utils import atomic_operation, with_connection_retry, with_read_retry
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +28,7 @@ class DepositService:
         return DepositService._deposit_locks.locks[account_number]
     
     @staticmethod
-    @with_connection_retry(max_retries=3)
+    @with_connection_retry(max_retries=3, idempotent=False)
     @atomic_operation("Fund deposit to account")
     def deposit_funds(db: Session, deposit_data: DepositRequest) -> DepositResponse:
         """
@@ -74,8 +74,7 @@ class DepositService:
                 from_account=None,  # Deposits don't have a source account
                 to_account=deposit_data.account_number,
                 amount=deposit_data.amount,
-                transaction_type=TransactionType.DEPOSIT,
-                created_at=datetime.now()
+                transaction_type=TransactionType.DEPOSIT
             )
             
             # Save changes atomically (commit happens in atomic_operation decorator)
@@ -111,7 +110,7 @@ class DepositService:
                 logger.error(f"Error releasing lock for deposit to account {deposit_data.account_number}: {e}")
     
     @staticmethod
-    @with_connection_retry(max_retries=2)
+    @with_read_retry(max_retries=2)
     def get_account_balance(db: Session, account_number: str) -> float:
         """
         Get current balance for an account with connection retry
@@ -126,16 +125,12 @@ class DepositService:
         Raises:
             ValueError: If account not found
         """
-        try:
-            user = db.query(User).filter_by(account_number=account_number).first()
-            
-            if not user:
-                raise ValueError(f"Account {account_number} not found")
-            
-            return float(user.balance) if user.balance else 0.0
-        except Exception as e:
-            logger.error(f"Error getting balance for account {account_number}: {e}")
-            raise
+        user = db.query(User).filter_by(account_number=account_number).first()
+        
+        if not user:
+            raise ValueError(f"Account {account_number} not found")
+        
+        return float(user.balance) if user.balance else 0.0
     
     @staticmethod
     def get_concurrent_deposit_status(db: Session, account_number: str) -> dict:
@@ -151,8 +146,7 @@ class DepositService:
         """
         try:
             # Check if there are any active deposit transactions for this account
-            from datetime import timedelta
-            one_minute_ago = datetime.now() - timedelta(minutes=1)
+            one_minute_ago = datetime.now(timezone.utc) - timedelta(minutes=1)
             
             active_deposits = db.query(Transaction).filter(
                 Transaction.to_account == account_number,
@@ -215,10 +209,6 @@ class DepositService:
             if account_lock.locked():
                 validation_result["warnings"].append(f"Account {deposit_data.account_number} is currently being used in another operation")
             
-            # Check database connection health
-            if not TransactionManager.check_connection_health(db):
-                validation_result["warnings"].append("Database connection health check failed")
-            
         except Exception as e:
             validation_result["valid"] = False
             validation_result["errors"].append(f"Validation error: {str(e)}")
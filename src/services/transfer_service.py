@@ -1,15 +1,16 @@
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError, OperationalError
-from sqlalchemy import and_
+from sqlalchemy import func, literal_column, select, union_all
+from sqlalchemy.orm import aliased
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 import uuid
 import threading
 from typing import Optional
 
 from src.models import User, Transaction, TransactionType
 from src.schemas import TransferRequest, TransferResponse
-from src.utils import TransactionManager, atomic_operation, with_connection_retry
+from src.utils import atomic_operation, with_connection_retry, with_read_retry
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +32,7 @@ class TransferService:
         return TransferService._transfer_locks.locks[account_number]
     
     @staticmethod
-    @with_connection_retry(max_retries=3)
+    @with_connection_retry(max_retries=3, idempotent=False)
     @atomic_operation("Fund transfer between accounts")
     def transfer_funds(db: Session, transfer_data: TransferRequest) -> TransferResponse:
         """
@@ -82,20 +83,12 @@ class TransferService:
             if not to_user:
                 raise ValueError(f"Destination account {transfer_data.to_account} not found")
             
-            # Check sufficient balance with proper decimal handling
+            # Check sufficient balance with proper decimal handling. Both rows were
+            # loaded after the locks were taken, so no refresh is needed here.
             from_balance = float(from_user.balance) if from_user.balance else 0.0
             if from_balance < transfer_data.amount:
                 raise ValueError(f"Insufficient balance. Available: ${from_balance:.2f}, Required: ${transfer_data.amount:.2f}")
             
-            # Verify accounts are still valid (double-check after lock acquisition)
-            db.refresh(from_user)
-            db.refresh(to_user)
-            
-            # Re-check balance after refresh
-            current_from_balance = float(from_user.balance) if from_user.balance else 0.0
-            if current_from_balance < transfer_data.amount:
-                raise ValueError(f"Insufficient balance after verification. Available: ${current_from_balance:.2f}, Required: ${transfer_data.amount:.2f}")
-            
             # Perform atomic transfer operations
             # 1. Debit from source account
             from_user.update_balance(-transfer_data.amount)
@@ -108,14 +101,13 @@ class TransferService:
                 from_account=transfer_data.from_account,
                 to_account=transfer_data.to_account,
                 amount=transfer_data.amount,
-                transaction_type=TransactionType.TRANSFER,
-                created_at=datetime.now()
+                transaction_type=TransactionType.TRANSFER
             )
             
             # 4. Save all changes atomically (commit happens in atomic_operation decorator)
             db.add(transaction)
             
-            # Get final balances for response
+            # Get final balances for response (update_balance already set them locally)
             final_from_balance = float(from_user.balance)
             final_to_balance = float(to_user.balance)
             
@@ -150,7 +142,7 @@ class TransferService:
                 logger.error(f"Error releasing locks for transfer {transfer_id}: {e}")
     
     @staticmethod
-    @with_connection_retry(max_retries=2)
+    @with_read_retry(max_retries=2)
     def get_transfer_history(db: Session, account_number: str, limit: int = 10) -> list:
         """
         Get transfer history for an account with connection retry
@@ -163,35 +155,48 @@ class TransferService:
         Returns:
             list: List of transaction records
         """
-        try:
-            # Verify account exists
-            user = db.query(User).filter_by(account_number=account_number).first()
-            if not user:
-                raise ValueError(f"Account {account_number} not found")
-            
-            # Get transactions where account is sender or receiver
-            transactions = db.query(Transaction).filter(
-                (Transaction.from_account == account_number) | 
-                (Transaction.to_account == account_number)
-            ).order_by(Transaction.created_at.desc()).limit(limit).all()
-            
-            return [
-                {
-                    "id": t.id,
-                    "from_account": t.from_account,
-                    "to_account": t.to_account,
-                    "amount": float(t.amount),
-                    "transaction_type": t.transaction_type.value,
-                    "created_at": t.created_at.isoformat() if t.created_at else None
-                }
-                for t in transactions
-            ]
-        except Exception as e:
-            logger.error(f"Error getting transfer history for account {account_number}: {e}")
-            raise
+        # Verify account exists
+        user = db.query(User).filter_by(account_number=account_number).first()
+        if not user:
+            raise ValueError(f"Account {account_number} not found")
+        
+        # Get transactions where account is sender or receiver. Each side is
+        # a separate index range scan on (account, created_at), merged with
+        # UNION ALL instead of an OR filter the planner can't index well.
+        sent = (
+            select(Transaction)
+            .where(Transaction.from_account == account_number)
+            .order_by(Transaction.created_at.desc(), Transaction.id.desc())
+            .limit(limit)
+            .subquery()
+        )
+        received = (
+            select(Transaction)
+            .where(
+                Transaction.to_account == account_number,
+                Transaction.from_account.is_distinct_from(account_number)
+            )
+            .order_by(Transaction.created_at.desc(), Transaction.id.desc())
+            .limit(limit)
+            .subquery()
+        )
+        history = aliased(Transaction, union_all(select(sent), select(received)).subquery())
+        transactions = db.query(history).order_by(history.created_at.desc(), history.id.desc()).limit(limit).all()
+        
+        return [
+            {
+                "id": t.id,
+                "from_account": t.from_account,
+                "to_account": t.to_account,
+                "amount": float(t.amount),
+                "transaction_type": t.transaction_type.value,
+                "created_at": t.created_at.isoformat() if t.created_at else None
+            }
+            for t in transactions
+        ]
     
     @staticmethod
-    @with_connection_retry(max_retries=2)
+    @with_read_retry(max_retries=2)
     def get_account_balance(db: Session, account_number: str) -> float:
         """
         Get current balance for an account with connection retry
@@ -206,16 +211,12 @@ class TransferService:
         Raises:
             ValueError: If account not found
         """
-        try:
-            user = db.query(User).filter_by(account_number=account_number).first()
-            
-            if not user:
-                raise ValueError(f"Account {account_number} not found")
-            
-            return float(user.balance) if user.balance else 0.0
-        except Exception as e:
-            logger.error(f"Error getting balance for account {account_number}: {e}")
-            raise
+        user = db.query(User).filter_by(account_number=account_number).first()
+        
+        if not user:
+            raise ValueError(f"Account {account_number} not found")
+        
+        return float(user.balance) if user.balance else 0.0
     
     @staticmethod
     def get_concurrent_transfer_status(db: Session, account_number: str) -> dict:
@@ -230,14 +231,21 @@ class TransferService:
             dict: Concurrent transfer information
         """
         try:
-            # Check if there are any active transactions for this account
-            active_transactions = db.query(Transaction).filter(
-                and_(
-                    (Transaction.from_account == account_number) | 
-                    (Transaction.to_account == account_number),
-                    Transaction.created_at >= datetime.now().replace(second=0, microsecond=0)
-                )
-            ).count()
+            # Count transactions for this account in the last minute. Each side is
+            # a bounded range count on the (account, created_at) indexes, summed
+            # in a single round trip instead of counting rows behind an OR filter.
+            one_minute_ago = datetime.now(timezone.utc) - timedelta(minutes=1)
+            row_count = func.count(literal_column('1'))
+            sent = select(row_count).where(
+                Transaction.from_account == account_number,
+                Transaction.created_at >= one_minute_ago
+            ).scalar_subquery()
+            received = select(row_count).where(
+                Transaction.to_account == account_number,
+                Transaction.from_account.is_distinct_from(account_number),
+                Transaction.created_at >= one_minute_ago
+            ).scalar_subquery()
+            active_transactions = db.execute(select(sent + received)).scalar()
             
             # Get lock status
             lock = TransferService._get_transfer_lock(account_number)
@@ -317,10 +325,6 @@ class TransferService:
             if to_lock.locked():
                 validation_result["warnings"].append(f"Destination account {transfer_data.to_account} is currently being used in another transfer")
             
-            # Check database connection health
-            if not TransactionManager.check_connection_health(db):
-                validation_result["warnings"].append("Database connection health check failed")
-            
         except Exception as e:
             validation_result["valid"] = False
             validation_result["errors"].append(f"Validation error: {str(e)}")
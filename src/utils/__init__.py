@@ -1,5 +1,5 @@
 # Utils Package
-from .auth import hash_password, verify_password
+from .auth import hash_password, verify_password, hash_password_async, verify_password_async
 from .account import (
     generate_account_number,
     is_account_number_unique,
@@ -11,7 +11,8 @@ from .password_strength import check_password_strength, is_password_strong_enoug
 from .transaction_manager import (
     TransactionManager,
     atomic_operation,
-    with_connection_retry
+    with_connection_retry,
+    with_read_retry
 )
 from .error_handler import (
     ValidationErrorHandler,
@@ -32,6 +33,8 @@ from .error_handler import (
 __all__ = [
     'hash_password',
     'verify_password',
+    'hash_password_async',
+    'verify_password_async',
     'generate_account_number',
     'is_account_number_unique',
     'validate_account_number',
@@ -43,6 +46,7 @@ __all__ = [
     'TransactionManager',
     'atomic_operation',
     'with_connection_retry',
+    'with_read_retry',
     'ValidationErrorHandler',
     'BusinessLogicError',
     'DatabaseError',
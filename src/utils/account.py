@@ -1,14 +1,38 @@
-import random
+import secrets
 import string
 import logging
 import re
+from collections import Counter
+from functools import lru_cache
 from typing import Optional
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from src.models import User
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=None)
+def _ascending_run_pattern(run_length: int) -> re.Pattern:
+    """
+    Compile a regex matching any run of run_length ascending digits
+    
+    Args:
+        run_length (int): Number of consecutive ascending digits
+        
+    Returns:
+        re.Pattern: Compiled pattern (never matches if run_length exceeds 10)
+    """
+    runs = [string.digits[i:i + run_length] for i in range(len(string.digits) - run_length + 1)]
+    return re.compile('|'.join(runs) if runs and run_length > 0 else '(?!)')
+
+# Dialect-specific INSERT constructs supporting ON CONFLICT DO NOTHING
+CONFLICT_INSERTS = {
+    'postgresql': postgresql_insert,
+    'sqlite': sqlite_insert,
+}
+
 class AccountNumberGenerator:
     """Enhanced account number generation system"""
     
@@ -17,19 +41,20 @@ class AccountNumberGenerator:
     MAX_LENGTH = 12
     MIN_LENGTH = 8
     MAX_ATTEMPTS = 1000  # Increased for better uniqueness guarantee
+    BATCH_SIZE = 64  # Candidates checked per uniqueness query
     
     # Account number patterns (for validation)
     PATTERN_10_DIGIT = re.compile(r'^\d{10}$')
     PATTERN_12_DIGIT = re.compile(r'^\d{12}$')
     
     # Reserved patterns (avoid common sequences)
-    RESERVED_PATTERNS = [
-        '0000000000',  # All zeros
-        '1111111111',  # All ones
+    RESERVED_PATTERNS = frozenset({
         '1234567890',  # Sequential
         '0987654321',  # Reverse sequential
-        '9999999999',  # All nines
-    ]
+    }) | frozenset(
+        # All zeros, all ones and all nines at every supported length
+        digit * length for length in range(MIN_LENGTH, MAX_LENGTH + 1) for digit in '019'
+    )
     
     @classmethod
     def generate_account_number(cls, db: Session, length: int = DEFAULT_LENGTH) -> str:
@@ -51,22 +76,28 @@ class AccountNumberGenerator:
         if not cls.MIN_LENGTH <= length <= cls.MAX_LENGTH:
             raise ValueError(f"Account number length must be between {cls.MIN_LENGTH} and {cls.MAX_LENGTH} digits")
         
-        logger.info(f"Generating account number with length {length}")
+        logger.info("Generating account number with length %d", length)
         
-        for attempt in range(cls.MAX_ATTEMPTS):
+        attempts = 0
+        while attempts < cls.MAX_ATTEMPTS:
             try:
-                # Generate candidate account number
-                account_number = cls._generate_candidate(length)
+                # Generate and validate a batch of candidates in-process
+                batch_size = min(cls.BATCH_SIZE, cls.MAX_ATTEMPTS - attempts)
+                attempts += batch_size
+                candidates = [cls._generate_candidate(length) for _ in range(batch_size)]
+                candidates = [c for c in candidates if cls._validate_generated(c)]
+                if not candidates:
+                    continue
                 
-                # Validate the candidate
-                if cls._is_valid_candidate(account_number):
-                    # Check uniqueness in database
-                    if cls._is_unique_in_db(db, account_number):
-                        logger.info(f"Generated unique account number: {account_number} (attempt {attempt + 1})")
+                # Check uniqueness of the whole batch in a single query
+                taken = cls._find_existing(db, candidates)
+                for account_number in candidates:
+                    if account_number not in taken:
+                        logger.info("Generated unique account number: %s (%d candidates generated)", account_number, attempts)
                         return account_number
                 
             except Exception as e:
-                logger.warning(f"Error during account number generation attempt {attempt + 1}: {e}")
+                logger.warning("Error during account number generation (%d candidates generated): %s", attempts, e)
                 continue
         
         # If we reach here, we couldn't generate a unique number
@@ -74,6 +105,102 @@ class AccountNumberGenerator:
         logger.error(error_msg)
         raise Exception(error_msg)
     
+    @classmethod
+    def generate_many(cls, db: Session, count: int, length: int = DEFAULT_LENGTH) -> list:
+        """
+        Generate several unique account numbers with one uniqueness query per batch
+        
+        Intended for bulk onboarding, where generating numbers one user at a time
+        would cost a database round trip per user.
+        
+        Args:
+            db (Session): Database session
+            count (int): Number of account numbers to generate
+            length (int): Length of account numbers (8-12 digits)
+            
+        Returns:
+            list: Distinct account numbers not present in the database
+            
+        Raises:
+            ValueError: If length is invalid
+            Exception: If unable to generate enough unique numbers
+        """
+        # Validate length
+        if not cls.MIN_LENGTH <= length <= cls.MAX_LENGTH:
+            raise ValueError(f"Account number length must be between {cls.MIN_LENGTH} and {cls.MAX_LENGTH} digits")
+        
+        account_numbers = []
+        seen = set()
+        attempts = 0
+        while len(account_numbers) < count and attempts < cls.MAX_ATTEMPTS * max(count, 1):
+            # Over-generate to absorb rejected and colliding candidates
+            batch_size = max(cls.BATCH_SIZE, (count - len(account_numbers)) * 2)
+            attempts += batch_size
+            candidates = {cls._generate_candidate(length) for _ in range(batch_size)} - seen
+            candidates = [c for c in candidates if cls._validate_generated(c)]
+            seen.update(candidates)
+            if not candidates:
+                continue
+            
+            taken = cls._find_existing(db, candidates)
+            account_numbers.extend(c for c in candidates if c not in taken)
+        
+        if len(account_numbers) < count:
+            error_msg = f"Could not generate {count} unique account numbers after {attempts} candidates"
+            logger.error(error_msg)
+            raise Exception(error_msg)
+        
+        logger.info("Generated %d unique account numbers (%d candidates generated)", count, attempts)
+        return account_numbers[:count]
+    
+    @classmethod
+    def generate_and_insert(cls, db: Session, user_data: dict, length: int = DEFAULT_LENGTH) -> str:
+        """
+        Generate an account number and insert the user in one statement
+        
+        Uniqueness is enforced by the database: each candidate is inserted with
+        ON CONFLICT DO NOTHING on account_number, and a new candidate is tried
+        only when no row was written. Dialects without conflict handling fall
+        back to generate_account_number plus a regular insert.
+        
+        Args:
+            db (Session): Database session
+            user_data (dict): User column values, excluding account_number
+            length (int): Length of account number (8-12 digits)
+            
+        Returns:
+            str: Account number of the inserted user
+            
+        Raises:
+            ValueError: If length is invalid
+            Exception: If unable to insert with a unique number
+        """
+        # Validate length
+        if not cls.MIN_LENGTH <= length <= cls.MAX_LENGTH:
+            raise ValueError(f"Account number length must be between {cls.MIN_LENGTH} and {cls.MAX_LENGTH} digits")
+        
+        insert_factory = CONFLICT_INSERTS.get(db.get_bind().dialect.name)
+        if insert_factory is None:
+            account_number = cls.generate_account_number(db, length)
+            db.add(User(account_number=account_number, **user_data))
+            db.flush()
+            return account_number
+        
+        for attempt in range(cls.MAX_ATTEMPTS):
+            account_number = cls._generate_candidate(length)
+            if not cls._validate_generated(account_number):
+                continue
+            
+            stmt = insert_factory(User).values(account_number=account_number, **user_data)
+            result = db.execute(stmt.on_conflict_do_nothing(index_elements=['account_number']))
+            if result.rowcount:
+                logger.info("Inserted user with account number: %s (attempt %d)", account_number, attempt + 1)
+                return account_number
+        
+        error_msg = f"Could not insert user with unique account number after {cls.MAX_ATTEMPTS} attempts"
+        logger.error(error_msg)
+        raise Exception(error_msg)
+    
     @classmethod
     def _generate_candidate(cls, length: int) -> str:
         """
@@ -86,10 +213,9 @@ class AccountNumberGenerator:
             str: Candidate account number
         """
         # Use cryptographically secure random number generation
-        # Avoid leading zeros for better readability
-        first_digit = random.choice('123456789')  # Avoid leading zero
-        remaining_digits = ''.join(random.choices(string.digits, k=length - 1))
-        return first_digit + remaining_digits
+        # Drawing from [10^(length-1), 10^length) avoids leading zeros by construction
+        lower_bound = 10 ** (length - 1)
+        return str(secrets.randbelow(9 * lower_bound) + lower_bound)
     
     @classmethod
     def _is_valid_candidate(cls, account_number: str) -> bool:
@@ -128,6 +254,26 @@ class AccountNumberGenerator:
         
         return True
     
+    @classmethod
+    def _validate_generated(cls, account_number: str) -> bool:
+        """
+        Validate a candidate produced by _generate_candidate
+        
+        Length, digits-only and leading zero are guaranteed by construction,
+        so only the pattern checks from _is_valid_candidate are run.
+        
+        Args:
+            account_number (str): Generated account number to validate
+            
+        Returns:
+            bool: True if valid, False otherwise
+        """
+        return (
+            account_number not in cls.RESERVED_PATTERNS
+            and not cls._has_too_many_consecutive(account_number)
+            and not cls._has_too_many_repeated(account_number)
+        )
+    
     @classmethod
     def _has_too_many_consecutive(cls, account_number: str, max_consecutive: int = 4) -> bool:
         """
@@ -140,15 +286,9 @@ class AccountNumberGenerator:
         Returns:
             bool: True if too many consecutive digits
         """
-        consecutive_count = 1
-        for i in range(1, len(account_number)):
-            if int(account_number[i]) == int(account_number[i-1]) + 1:
-                consecutive_count += 1
-                if consecutive_count > max_consecutive:
-                    return True
-            else:
-                consecutive_count = 1
-        return False
+        # A run longer than max_consecutive is one of a handful of fixed
+        # ascending substrings, so a single compiled regex scan finds it
+        return _ascending_run_pattern(max_consecutive + 1).search(account_number) is not None
     
     @classmethod
     def _has_too_many_repeated(cls, account_number: str, max_repeated: int = 3) -> bool:
@@ -162,10 +302,11 @@ class AccountNumberGenerator:
         Returns:
             bool: True if too many repeated digits
         """
-        for digit in string.digits:
-            if account_number.count(digit) > max_repeated:
-                return True
-        return False
+        # Single counting pass over the string, stopping at the first offending digit
+        return any(
+            count > max_repeated and char in string.digits
+            for char, count in Counter(account_number).items()
+        )
     
     @classmethod
     def _is_unique_in_db(cls, db: Session, account_number: str) -> bool:
@@ -183,9 +324,24 @@ class AccountNumberGenerator:
             existing_user = db.query(User).filter_by(account_number=account_number).first()
             return existing_user is None
         except Exception as e:
-            logger.error(f"Error checking account number uniqueness: {e}")
+            logger.error("Error checking account number uniqueness: %s", e)
             return False
     
+    @classmethod
+    def _find_existing(cls, db: Session, candidates: list) -> set:
+        """
+        Find which candidate account numbers already exist in database
+        
+        Args:
+            db (Session): Database session
+            candidates (list): Account numbers to check
+            
+        Returns:
+            set: Candidates that are already taken
+        """
+        rows = db.query(User.account_number).filter(User.account_number.in_(candidates)).all()
+        return {row[0] for row in rows}
+    
     @classmethod
     def validate_account_number_format(cls, account_number: str) -> bool:
         """
@@ -225,22 +381,18 @@ class AccountNumberGenerator:
         Returns:
             dict: Information about the account number
         """
-        info = {
+        # Analyze digit distribution in a single counting pass
+        counts = Counter(account_number)
+        digit_distribution = {digit: counts[digit] for digit in string.digits if counts[digit]}
+        
+        return {
             'length': len(account_number),
             'is_valid_format': cls.validate_account_number_format(account_number),
             'is_reserved': account_number in cls.RESERVED_PATTERNS,
             'has_consecutive': cls._has_too_many_consecutive(account_number),
-            'has_repeated': cls._has_too_many_repeated(account_number),
-            'digit_distribution': {}
+            'has_repeated': max(digit_distribution.values(), default=0) > 3,
+            'digit_distribution': digit_distribution
         }
-        
-        # Analyze digit distribution
-        for digit in string.digits:
-            count = account_number.count(digit)
-            if count > 0:
-                info['digit_distribution'][digit] = count
-        
-        return info
 
 # Backward compatibility functions
 def generate_account_number(db: Session, length: int = 10) -> str:
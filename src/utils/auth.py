@@ -1,8 +1,15 @@
+import asyncio
 import bcrypt
 import logging
 
+from config import settings
+
 logger = logging.getLogger(__name__)
 
+# bcrypt work factor. Hashing is CPU-bound (Blowfish key schedule), so the only
+# levers are this cost and running hashes off the request thread.
+BCRYPT_ROUNDS = settings.bcrypt_rounds
+
 def hash_password(password: str) -> str:
     """
     Hash a password using bcrypt
@@ -18,13 +25,13 @@ def hash_password(password: str) -> str:
         password_bytes = password.encode('utf-8')
         
         # Generate salt and hash password
-        salt = bcrypt.gensalt()
+        salt = bcrypt.gensalt(BCRYPT_ROUNDS)
         hashed = bcrypt.hashpw(password_bytes, salt)
         
         # Return hashed password as string
         return hashed.decode('utf-8')
     except Exception as e:
-        logger.error(f"Error hashing password: {e}")
+        logger.error("Error hashing password: %s", e)
         raise
 
 def verify_password(password: str, hashed_password: str) -> bool:
@@ -46,5 +53,30 @@ def verify_password(password: str, hashed_password: str) -> bool:
         # Verify password
         return bcrypt.checkpw(password_bytes, hashed_bytes)
     except Exception as e:
-        logger.error(f"Error verifying password: {e}")
-        return False 
\ No newline at end of file
+        logger.error("Error verifying password: %s", e)
+        return False
+
+async def hash_password_async(password: str) -> str:
+    """
+    Hash a password in a worker thread without blocking the event loop
+    
+    Args:
+        password (str): Plain text password
+        
+    Returns:
+        str: Hashed password
+    """
+    return await asyncio.get_running_loop().run_in_executor(None, hash_password, password)
+
+async def verify_password_async(password: str, hashed_password: str) -> bool:
+    """
+    Verify a password in a worker thread without blocking the event loop
+    
+    Args:
+        password (str): Plain text password to verify
+        hashed_password (str): Hashed password to check against
+        
+    Returns:
+        bool: True if password matches, False otherwise
+    """
+    return await asyncio.get_running_loop().run_in_executor(None, verify_password, password, hashed_password)
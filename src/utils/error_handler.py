@@ -3,13 +3,63 @@ Error Handling Utilities
 Provides centralized error handling and consistent error responses
 """
 import logging
+import re
 from typing import Dict, Any, Optional, Union
 from pydantic import ValidationError
 from sqlalchemy.exc import IntegrityError, OperationalError
 from flask import jsonify
 
+from .password_strength import COMMON_PASSWORD_RE, SEQUENTIAL_DIGITS_RE, scan_character_classes
+
 logger = logging.getLogger(__name__)
 
+def _trie_alternation(words) -> str:
+    """
+    Build a regex alternation with shared prefixes factored out
+    
+    The regex engine then tests each shared prefix once per position instead of
+    once per word, approximating an Aho-Corasick scan with the standard re module.
+    
+    Args:
+        words: Literal strings to match
+        
+    Returns:
+        str: Regex source matching any of the words
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+    
+    def render(node: dict) -> str:
+        branches = [re.escape(char) + render(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        if '' in node:
+            return '(?:' + '|'.join(branches) + ')?'
+        if len(branches) == 1:
+            return branches[0]
+        return '(?:' + '|'.join(branches) + ')'
+    
+    return render(trie)
+
+# Potentially dangerous input patterns, matched in a single pass by one compiled regex
+DANGEROUS_PATTERNS = (
+    '<script', 'javascript:', 'data:', 'vbscript:', 'onload=',
+    'onerror=', 'onclick=', 'eval(', 'document.cookie'
+)
+DANGEROUS_PATTERN_RE = re.compile(_trie_alternation(DANGEROUS_PATTERNS), re.IGNORECASE)
+
+# Translation table deleting control characters other than tab, newline and carriage return
+CONTROL_CHAR_TABLE = dict.fromkeys([i for i in range(32) if chr(i) not in '\n\r\t'])
+
+# Phone number patterns
+PHONE_STRIP_RE = re.compile(r'[^\d+]')
+PHONE_ZERO_COUNTRY_CODE_RE = re.compile(r'^\+0+')
+PHONE_ALL_ONES_RE = re.compile(r'^\+1{10,}')
+
 class ValidationErrorHandler:
     """Handles validation errors and provides detailed feedback"""
     
@@ -24,19 +74,15 @@ class ValidationErrorHandler:
         Returns:
             dict: Formatted error response
         """
-        errors = []
-        
-        for error_detail in error.errors():
-            field = error_detail.get('loc', ['unknown'])[-1] if error_detail.get('loc') else 'unknown'
-            message = error_detail.get('msg', 'Validation error')
-            error_type = error_detail.get('type', 'value_error')
-            
-            errors.append({
-                'field': field,
-                'message': message,
-                'type': error_type,
+        errors = [
+            {
+                'field': loc[-1] if (loc := error_detail.get('loc')) else 'unknown',
+                'message': error_detail.get('msg', 'Validation error'),
+                'type': error_detail.get('type', 'value_error'),
                 'value': error_detail.get('input', 'N/A')
-            })
+            }
+            for error_detail in error.errors()
+        ]
         
         return {
             'error': 'Validation error',
@@ -85,7 +131,7 @@ def handle_validation_error(error: ValidationError) -> tuple:
         tuple: Flask response tuple (json, status_code)
     """
     formatted_error = ValidationErrorHandler.format_validation_error(error)
-    logger.warning(f"Validation error: {formatted_error}")
+    logger.warning("Validation error: %s", formatted_error)
     return jsonify(formatted_error), 400
 
 def handle_business_logic_error(error: BusinessLogicError) -> tuple:
@@ -103,7 +149,7 @@ def handle_business_logic_error(error: BusinessLogicError) -> tuple:
         'code': error.code,
         'field': error.field
     }
-    logger.warning(f"Business logic error: {error_response}")
+    logger.warning("Business logic error: %s", error_response)
     return jsonify(error_response), error.status_code
 
 def handle_database_error(error: Union[DatabaseError, IntegrityError, OperationalError]) -> tuple:
@@ -145,7 +191,7 @@ def handle_database_error(error: Union[DatabaseError, IntegrityError, Operationa
         }
         status_code = 500
     
-    logger.error(f"Database error: {error_response}")
+    logger.error("Database error: %s", error_response)
     return jsonify(error_response), status_code
 
 def handle_security_error(error: SecurityError) -> tuple:
@@ -163,7 +209,7 @@ def handle_security_error(error: SecurityError) -> tuple:
         'code': error.code,
         'details': 'Security validation failed'
     }
-    logger.warning(f"Security error: {error_response}")
+    logger.warning("Security error: %s", error_response)
     return jsonify(error_response), error.status_code
 
 def handle_generic_error(error: Exception, context: str = "Unknown operation") -> tuple:
@@ -182,7 +228,7 @@ def handle_generic_error(error: Exception, context: str = "Unknown operation") -
         'code': 'INTERNAL_ERROR',
         'details': f'An unexpected error occurred during {context}'
     }
-    logger.error(f"Unexpected error during {context}: {str(error)}", exc_info=True)
+    logger.error("Unexpected error during %s: %s", context, error, exc_info=True)
     return jsonify(error_response), 500
 
 def create_error_response(
@@ -216,7 +262,7 @@ def create_error_response(
     if details:
         error_response['details'] = details
     
-    logger.warning(f"Error response: {error_response}")
+    logger.warning("Error response: %s", error_response)
     return jsonify(error_response), status_code
 
 def sanitize_input(value: str, max_length: int = 1000) -> str:
@@ -241,18 +287,12 @@ def sanitize_input(value: str, max_length: int = 1000) -> str:
         raise SecurityError(f"Input too long (max {max_length} characters)", "INPUT_TOO_LONG")
     
     # Remove null bytes and control characters
-    sanitized = ''.join(char for char in value if ord(char) >= 32 or char in '\n\r\t')
+    sanitized = value.translate(CONTROL_CHAR_TABLE)
     
     # Check for potentially dangerous patterns
-    dangerous_patterns = [
-        '<script', 'javascript:', 'data:', 'vbscript:', 'onload=',
-        'onerror=', 'onclick=', 'eval(', 'document.cookie'
-    ]
-    
-    sanitized_lower = sanitized.lower()
-    for pattern in dangerous_patterns:
-        if pattern in sanitized_lower:
-            raise SecurityError(f"Input contains potentially dangerous content: {pattern}", "DANGEROUS_INPUT")
+    dangerous_match = DANGEROUS_PATTERN_RE.search(sanitized)
+    if dangerous_match:
+        raise SecurityError(f"Input contains potentially dangerous content: {dangerous_match.group(0).lower()}", "DANGEROUS_INPUT")
     
     return sanitized.strip()
 
@@ -266,10 +306,8 @@ def validate_phone_number(phone: str) -> bool:
     Returns:
         bool: True if valid, False otherwise
     """
-    import re
-    
     # Remove any non-digit characters except +
-    phone_clean = re.sub(r'[^\d+]', '', phone)
+    phone_clean = PHONE_STRIP_RE.sub('', phone)
     
     # Check if it starts with + (country code)
     if not phone_clean.startswith('+'):
@@ -283,10 +321,10 @@ def validate_phone_number(phone: str) -> bool:
         return False
     
     # Check for common invalid patterns
-    if re.match(r'^\+0+', phone_clean):
+    if PHONE_ZERO_COUNTRY_CODE_RE.match(phone_clean):
         return False
     
-    if re.match(r'^\+1{10,}', phone_clean):
+    if PHONE_ALL_ONES_RE.match(phone_clean):
         return False
     
     return True
@@ -301,8 +339,6 @@ def validate_password_strength(password: str) -> Dict[str, Any]:
     Returns:
         dict: Validation result with details
     """
-    import re
-    
     result = {
         'is_valid': True,
         'score': 0,
@@ -324,29 +360,31 @@ def validate_password_strength(password: str) -> Dict[str, Any]:
         result['feedback'].append("Password must be at least 8 characters long")
         result['is_valid'] = False
     
-    # Character variety checks
-    if re.search(r'[a-z]', password):
+    # Character variety checks (single pass over the password)
+    has_lowercase, has_uppercase, has_digit, has_special = scan_character_classes(password)
+    
+    if has_lowercase:
         result['requirements_met']['lowercase'] = True
         result['score'] += 1
     else:
         result['feedback'].append("Password must contain at least one lowercase letter")
         result['is_valid'] = False
     
-    if re.search(r'[A-Z]', password):
+    if has_uppercase:
         result['requirements_met']['uppercase'] = True
         result['score'] += 1
     else:
         result['feedback'].append("Password must contain at least one uppercase letter")
         result['is_valid'] = False
     
-    if re.search(r'\d', password):
+    if has_digit:
         result['requirements_met']['digit'] = True
         result['score'] += 1
     else:
         result['feedback'].append("Password must contain at least one digit")
         result['is_valid'] = False
     
-    if re.search(r'[!@#$%^&*(),.?":{}|<>]', password):
+    if has_special:
         result['requirements_met']['special'] = True
         result['score'] += 1
     else:
@@ -354,20 +392,13 @@ def validate_password_strength(password: str) -> Dict[str, Any]:
         result['is_valid'] = False
     
     # Check for common weak patterns
-    common_patterns = [
-        'password', '123456', 'qwerty', 'admin', 'user',
-        'letmein', 'welcome', 'monkey', 'dragon', 'master'
-    ]
-    
-    password_lower = password.lower()
-    for pattern in common_patterns:
-        if pattern in password_lower:
-            result['feedback'].append(f"Avoid common patterns like '{pattern}'")
-            result['score'] -= 1
-            break
+    common_match = COMMON_PASSWORD_RE.search(password)
+    if common_match:
+        result['feedback'].append(f"Avoid common patterns like '{common_match.group(0).lower()}'")
+        result['score'] -= 1
     
     # Check for sequential characters
-    if re.search(r'(?:123|234|345|456|567|678|789|890|012)', password):
+    if SEQUENTIAL_DIGITS_RE.search(password):
         result['feedback'].append("Avoid sequential numbers")
         result['score'] -= 1
     
@@ -1,8 +1,50 @@
 import re
 import logging
+from functools import lru_cache
+from types import MappingProxyType
 
 logger = logging.getLogger(__name__)
 
+# Common weak password patterns, matched in a single pass by one compiled regex
+COMMON_PASSWORD_PATTERNS = (
+    'password', '123456', 'qwerty', 'admin', 'user',
+    'letmein', 'welcome', 'monkey', 'dragon', 'master'
+)
+COMMON_PASSWORD_RE = re.compile('|'.join(map(re.escape, COMMON_PASSWORD_PATTERNS)), re.IGNORECASE)
+
+# Special characters accepted by the password rules
+SPECIAL_CHARACTERS = frozenset('!@#$%^&*(),.?":{}|<>')
+
+# Runs of three ascending digits
+SEQUENTIAL_DIGITS_RE = re.compile(r'(?:123|234|345|456|567|678|789|890|012)')
+
+# Byte classification table: 1 = lowercase, 2 = uppercase, 3 = digit, 4 = special.
+# Non-ASCII bytes map to 0 and are handled separately for Unicode digits.
+CHAR_CLASS_TABLE = bytes(
+    1 if 97 <= i <= 122 else
+    2 if 65 <= i <= 90 else
+    3 if 48 <= i <= 57 else
+    4 if chr(i) in SPECIAL_CHARACTERS else 0
+    for i in range(128)
+) + bytes(128)
+
+def scan_character_classes(password: str) -> tuple:
+    """
+    Scan a password once and report which character classes it contains
+    
+    Args:
+        password (str): Password to scan
+        
+    Returns:
+        tuple: (has_lowercase, has_uppercase, has_digit, has_special)
+    """
+    classes = set(password.encode('utf-8', 'ignore').translate(CHAR_CLASS_TABLE))
+    has_digit = 3 in classes
+    if not has_digit and not password.isascii():
+        # \d also matches non-ASCII decimal digits
+        has_digit = any(char.isdecimal() for char in password)
+    return 1 in classes, 2 in classes, has_digit, 4 in classes
+
 def check_password_strength(password: str) -> dict:
     """
     Check password strength and return detailed analysis
@@ -25,23 +67,25 @@ def check_password_strength(password: str) -> dict:
     if len(password) >= 12:
         score += 1
     
-    # Character variety checks
-    if re.search(r'[a-z]', password):
+    # Character variety checks (single pass over the password)
+    has_lowercase, has_uppercase, has_digit, has_special = scan_character_classes(password)
+    
+    if has_lowercase:
         score += 1
     else:
         feedback.append("Password should contain at least one lowercase letter")
     
-    if re.search(r'[A-Z]', password):
+    if has_uppercase:
         score += 1
     else:
         feedback.append("Password should contain at least one uppercase letter")
     
-    if re.search(r'\d', password):
+    if has_digit:
         score += 1
     else:
         feedback.append("Password should contain at least one digit")
     
-    if re.search(r'[!@#$%^&*(),.?":{}|<>]', password):
+    if has_special:
         score += 1
     else:
         feedback.append("Password should contain at least one special character")
@@ -51,17 +95,10 @@ def check_password_strength(password: str) -> dict:
         score += 1
     
     # Common patterns to avoid
-    common_patterns = [
-        'password', '123456', 'qwerty', 'admin', 'user',
-        'letmein', 'welcome', 'monkey', 'dragon', 'master'
-    ]
-    
-    password_lower = password.lower()
-    for pattern in common_patterns:
-        if pattern in password_lower:
-            score -= 1
-            feedback.append(f"Avoid common patterns like '{pattern}'")
-            break
+    common_match = COMMON_PASSWORD_RE.search(password)
+    if common_match:
+        score -= 1
+        feedback.append(f"Avoid common patterns like '{common_match.group(0).lower()}'")
     
     # Determine strength level
     if score <= 2:
@@ -78,10 +115,10 @@ def check_password_strength(password: str) -> dict:
         "strength": strength,
         "feedback": feedback,
         "length": len(password),
-        "has_lowercase": bool(re.search(r'[a-z]', password)),
-        "has_uppercase": bool(re.search(r'[A-Z]', password)),
-        "has_digit": bool(re.search(r'\d', password)),
-        "has_special": bool(re.search(r'[!@#$%^&*(),.?":{}|<>]', password))
+        "has_lowercase": has_lowercase,
+        "has_uppercase": has_uppercase,
+        "has_digit": has_digit,
+        "has_special": has_special
     }
 
 def is_password_strong_enough(password: str, min_score: int = 4) -> bool:
@@ -98,31 +135,41 @@ def is_password_strong_enough(password: str, min_score: int = 4) -> bool:
     analysis = check_password_strength(password)
     return analysis["score"] >= min_score
 
-def get_password_requirements() -> dict:
+@lru_cache(maxsize=1)
+def _password_requirements() -> MappingProxyType:
     """
-    Get password requirements for user guidance
+    Build the static password requirements once
     
     Returns:
-        dict: Password requirements
+        MappingProxyType: Read-only password requirements
     """
-    return {
+    return MappingProxyType({
         "min_length": 8,
         "recommended_length": 12,
-        "required_chars": [
+        "required_chars": (
             "At least one lowercase letter (a-z)",
             "At least one uppercase letter (A-Z)",
             "At least one digit (0-9)",
             "At least one special character (!@#$%^&*(),.?\":{}|<>)"
-        ],
-        "avoid": [
+        ),
+        "avoid": (
             "Common words (password, admin, user, etc.)",
             "Sequential characters (123456, qwerty, etc.)",
             "Personal information (name, birthdate, etc.)"
-        ],
-        "tips": [
+        ),
+        "tips": (
             "Use a mix of letters, numbers, and symbols",
             "Make it at least 8 characters long",
             "Avoid using the same password for multiple accounts",
             "Consider using a passphrase instead of a single word"
-        ]
-    } 
\ No newline at end of file
+        )
+    })
+
+def get_password_requirements() -> dict:
+    """
+    Get password requirements for user guidance
+    
+    Returns:
+        dict: Password requirements (a fresh copy; nested values are tuples)
+    """
+    return dict(_password_requirements())
@@ -2,22 +2,133 @@
 Database Transaction Management Utilities
 Provides robust transaction handling with proper rollback mechanisms and concurrent access handling
 """
+import asyncio
+import hashlib
+import inspect
+import json
 import logging
+import random
+import re
+import threading
 import time
-from contextlib import contextmanager
-from typing import Optional, Callable, Any, Dict
-from functools import wraps
-from sqlalchemy.orm import Session
+from concurrent.futures import CancelledError
+from contextlib import asynccontextmanager, contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Callable, Any, Dict, Iterable, List, TypeVar
+from functools import lru_cache, wraps
+from sqlalchemy.orm import Session, scoped_session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import (
     IntegrityError, 
     OperationalError, 
     DisconnectionError,
     TimeoutError as SQLAlchemyTimeoutError
 )
-from sqlalchemy import text
+from sqlalchemy import bindparam, event, text
+from sqlalchemy.pool import Pool
+from src.models import Base, IdempotencyKey
+from .error_handler import BusinessLogicError
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar('T')
+
+# Session types recognised when scanning call arguments for a database session
+_SESSION_TYPES = (Session, scoped_session, AsyncSession)
+
+MAX_BACKOFF = 60  # seconds; upper bound for any single retry delay
+
+# Driver messages and error codes that indicate a retryable lock conflict
+_DEADLOCK_RE = re.compile(r'deadlock|lock wait timeout|serialization failure|could not serialize|database is locked', re.I)
+_DEADLOCK_CODES = frozenset({'40001', '40P01', 1205, 1213})  # SQLSTATE (PostgreSQL) / MySQL error numbers
+
+# Connection-record info key holding the MySQL lock wait timeout to restore on checkin
+_MYSQL_LOCK_TIMEOUT_KEY = "previous_innodb_lock_wait_timeout"
+
+
+@event.listens_for(Pool, "checkin")
+def _restore_mysql_lock_timeout(dbapi_connection, connection_record):
+    """
+    Restore a MySQL session lock wait timeout changed by _set_lock_timeout
+    
+    MySQL has no transaction-local form of innodb_lock_wait_timeout, so the
+    previous value is put back when the connection returns to the pool, before
+    an unrelated transaction can check it out.
+    """
+    previous = connection_record.info.pop(_MYSQL_LOCK_TIMEOUT_KEY, None)
+    if previous is None or dbapi_connection is None:
+        return
+    
+    try:
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute(f"SET SESSION innodb_lock_wait_timeout = {int(previous)}")
+        finally:
+            cursor.close()
+    except Exception as e:
+        # Never hand out a connection with the overridden timeout
+        logger.error("Failed to restore innodb_lock_wait_timeout, discarding connection: %s", e)
+        connection_record.invalidate(e)
+
+
+def _is_deadlock(exc: Exception) -> bool:
+    """
+    Check whether a database exception was caused by a deadlock or lock conflict
+    
+    Args:
+        exc (Exception): SQLAlchemy DBAPI-wrapped exception
+        
+    Returns:
+        bool: True if the error is a retryable lock conflict
+    """
+    orig = getattr(exc, 'orig', None)
+    code = getattr(orig, 'pgcode', None) or getattr(orig, 'sqlstate', None)
+    if code is None and getattr(orig, 'args', None):
+        code = orig.args[0]
+    try:
+        if code in _DEADLOCK_CODES:
+            return True
+    except TypeError:
+        pass
+    return bool(_DEADLOCK_RE.search(str(exc)))
+
+
+@lru_cache(maxsize=64)
+def _locking_stmt(table: str, dialect: str, nowait: bool = False):
+    """
+    Build (and cache) the row-locking statement for a table and dialect
+    
+    Args:
+        table (str): Table name, already checked against the allow-list
+        dialect (str): SQLAlchemy dialect name
+        nowait (bool): Append NOWAIT to the FOR UPDATE clause
+        
+    Returns:
+        TextClause: Statement taking a :row_id parameter
+    """
+    sql = f"SELECT id FROM {table} WHERE id = :row_id"
+    if dialect in ('postgresql', 'mysql'):
+        sql += " FOR UPDATE NOWAIT" if nowait else " FOR UPDATE"
+    return text(sql)
+
+
+@lru_cache(maxsize=64)
+def _batch_locking_stmt(table: str, dialect: str, nowait: bool = False):
+    """
+    Build (and cache) a statement that locks several rows in ascending id order
+    
+    Args:
+        table (str): Table name, already checked against the allow-list
+        dialect (str): SQLAlchemy dialect name (PostgreSQL or MySQL)
+        nowait (bool): Append NOWAIT to the FOR UPDATE clause
+        
+    Returns:
+        TextClause: Statement taking an expanding :row_ids parameter
+    """
+    sql = f"SELECT id FROM {table} WHERE id IN :row_ids ORDER BY id"
+    sql += " FOR UPDATE NOWAIT" if nowait else " FOR UPDATE"
+    return text(sql).bindparams(bindparam("row_ids", expanding=True))
+
 class TransactionManager:
     """Enhanced transaction management for database operations"""
     
@@ -26,6 +137,58 @@ class TransactionManager:
     RETRY_DELAY = 0.1  # seconds
     LOCK_TIMEOUT = 30  # seconds
     DEADLOCK_RETRY_DELAY = 0.5  # seconds
+    IDEMPOTENCY_KEY_TTL = timedelta(days=1)
+    TRANSACTION_DEPTH_KEY = "transaction_depth"  # Session.info key tracking managed nesting
+    LOCKABLE_TABLES = frozenset(Base.metadata.tables)
+    
+    HEALTH_CHECK_INTERVAL = 5.0  # seconds between health check round-trips
+    
+    # Last health check per database URL: (time.monotonic() timestamp, result)
+    _health_cache: Dict[str, tuple] = {}
+    
+    # PRAGMA values per database URL; they are fixed for the lifetime of the engine
+    _pragma_cache: Dict[str, Dict[str, Any]] = {}
+    
+    @staticmethod
+    def backoff_delay(base_delay: float, attempt: int) -> float:
+        """
+        Compute a capped exponential backoff delay with full jitter
+        
+        Args:
+            base_delay (float): Base delay in seconds
+            attempt (int): Zero-based attempt number
+            
+        Returns:
+            float: Delay in seconds, uniformly drawn from [0, min(MAX_BACKOFF, base_delay * 2**attempt)]
+        """
+        return random.uniform(0, min(MAX_BACKOFF, base_delay * (2 ** attempt)))
+    
+    @staticmethod
+    def wait_for_retry(delay: float, deadline: Optional[float] = None,
+                       cancel_event: Optional[threading.Event] = None) -> bool:
+        """
+        Wait before the next retry attempt, honouring a deadline and cancellation
+        
+        Args:
+            delay (float): Requested delay in seconds
+            deadline (float): time.monotonic() value after which no retry should start
+            cancel_event (threading.Event): Event that aborts the wait when set
+            
+        Returns:
+            bool: True if a retry may proceed, False if the deadline would be exceeded
+            
+        Raises:
+            CancelledError: If cancel_event is set before or during the wait
+        """
+        if deadline is not None and time.monotonic() + delay >= deadline:
+            return False
+        
+        if cancel_event is not None:
+            if cancel_event.wait(delay):
+                raise CancelledError("Retry cancelled")
+        else:
+            time.sleep(delay)
+        return True
     
     @classmethod
     @contextmanager
@@ -33,6 +196,10 @@ class TransactionManager:
         """
         Context manager for database transactions with automatic rollback on error
         
+        When used inside another managed transaction on the same session, a
+        SAVEPOINT is opened instead, so the inner block can roll back on its own
+        and the outer transaction remains responsible for the final commit.
+        
         Args:
             db (Session): Database session
             description (str): Description of the operation for logging
@@ -43,26 +210,86 @@ class TransactionManager:
         Raises:
             Exception: Any exception that occurs during the transaction
         """
-        logger.debug(f"Starting transaction: {description}")
+        depth = db.info.get(cls.TRANSACTION_DEPTH_KEY, 0)
+        db.info[cls.TRANSACTION_DEPTH_KEY] = depth + 1
+        
+        try:
+            if depth:
+                logger.debug("Starting nested transaction (savepoint): %s", description)
+                savepoint = db.begin_nested()
+                try:
+                    yield db
+                    savepoint.commit()
+                    logger.debug("Savepoint released: %s", description)
+                    
+                except Exception as e:
+                    if savepoint.is_active:
+                        savepoint.rollback()
+                    logger.error("Savepoint rolled back due to error: %s - %s", description, e)
+                    raise
+                return
+            
+            logger.debug("Starting transaction: %s", description)
+            
+            try:
+                yield db
+                db.commit()
+                logger.debug("Transaction committed successfully: %s", description)
+                
+            except Exception as e:
+                # Nothing to roll back if the session never began a transaction
+                if db.in_transaction():
+                    db.rollback()
+                logger.error("Transaction rolled back due to error: %s - %s", description, e)
+                raise
+        finally:
+            db.info[cls.TRANSACTION_DEPTH_KEY] = depth
+    
+    @classmethod
+    @asynccontextmanager
+    async def atransaction(cls, db: AsyncSession, description: str = "Database operation"):
+        """
+        Async context manager for AsyncSession transactions with automatic rollback on error
+        
+        Args:
+            db (AsyncSession): Async database session
+            description (str): Description of the operation for logging
+            
+        Yields:
+            AsyncSession: Async database session
+            
+        Raises:
+            Exception: Any exception that occurs during the transaction
+        """
+        logger.debug("Starting async transaction: %s", description)
         
         try:
             yield db
-            db.commit()
-            logger.debug(f"Transaction committed successfully: {description}")
+            await db.commit()
+            logger.debug("Async transaction committed successfully: %s", description)
             
         except Exception as e:
-            db.rollback()
-            logger.error(f"Transaction rolled back due to error: {description} - {e}")
+            await db.rollback()
+            logger.error("Async transaction rolled back due to error: %s - %s", description, e)
             raise
     
     @classmethod
-    def with_retry(cls, max_retries: int = None, retry_delay: float = None):
+    def with_retry(cls, max_retries: int = None, retry_delay: float = None,
+                   total_budget: float = None, cancel_event: threading.Event = None,
+                   idempotent: bool = True):
         """
-        Decorator for retrying database operations with exponential backoff
+        Decorator for retrying database operations with jittered exponential backoff
+        
+        Non-idempotent operations (idempotent=False) are only retried when the
+        caller passes an idempotency_key, so a commit whose acknowledgement was
+        lost is replayed from the stored result instead of being executed twice.
         
         Args:
             max_retries (int): Maximum number of retry attempts
             retry_delay (float): Base delay between retries
+            total_budget (float): Overall time budget in seconds across all attempts
+            cancel_event (threading.Event): Event that aborts pending retries when set
+            idempotent (bool): Whether the operation is safe to retry without an idempotency key
             
         Returns:
             Callable: Decorated function
@@ -73,87 +300,226 @@ class TransactionManager:
         def decorator(func: Callable) -> Callable:
             @wraps(func)
             def wrapper(*args, **kwargs):
-                last_exception = None
+                deadline = time.monotonic() + total_budget if total_budget else None
+                retries = max_retries if idempotent or kwargs.get('idempotency_key') else 0
+                attempt = 0
                 
-                for attempt in range(max_retries + 1):
+                while True:
                     try:
                         return func(*args, **kwargs)
                         
                     except (OperationalError, DisconnectionError, SQLAlchemyTimeoutError) as e:
-                        last_exception = e
-                        if attempt < max_retries:
-                            delay = retry_delay * (2 ** attempt)  # Exponential backoff
-                            logger.warning(f"Database operation failed (attempt {attempt + 1}/{max_retries + 1}): {e}")
-                            logger.info(f"Retrying in {delay:.2f} seconds...")
-                            time.sleep(delay)
-                        else:
-                            logger.error(f"Database operation failed after {max_retries + 1} attempts: {e}")
+                        if attempt >= retries:
+                            logger.error("Database operation failed after %d attempts: %s", retries + 1, e)
+                            raise
+                        
+                        delay = cls.backoff_delay(retry_delay, attempt)
+                        logger.warning("Database operation failed (attempt %d/%d): %s", attempt + 1, retries + 1, e)
+                        if not cls.wait_for_retry(delay, deadline, cancel_event):
+                            logger.error("Database operation retry budget exhausted after %d attempts: %s", attempt + 1, e)
                             raise
-                            
+                        logger.info("Retrying after %.2f seconds...", delay)
+                        
                     except IntegrityError as e:
                         # Integrity errors (constraint violations) should not be retried
-                        logger.error(f"Integrity error in database operation: {e}")
+                        logger.error("Integrity error in database operation: %s", e)
                         raise
                         
                     except Exception as e:
                         # Other exceptions should not be retried
-                        logger.error(f"Unexpected error in database operation: {e}")
+                        logger.error("Unexpected error in database operation: %s", e)
                         raise
+                    
+                    attempt += 1
+                
+            return wrapper
+        return decorator
+    
+    @classmethod
+    def awith_retry(cls, max_retries: int = None, retry_delay: float = None,
+                    total_budget: float = None):
+        """
+        Decorator for retrying async database operations with jittered exponential backoff
+        
+        Args:
+            max_retries (int): Maximum number of retry attempts
+            retry_delay (float): Base delay between retries
+            total_budget (float): Overall time budget in seconds across all attempts
+            
+        Returns:
+            Callable: Decorated coroutine function
+        """
+        max_retries = max_retries or cls.MAX_RETRIES
+        retry_delay = retry_delay or cls.RETRY_DELAY
+        
+        def decorator(func: Callable) -> Callable:
+            @wraps(func)
+            async def wrapper(*args, **kwargs):
+                deadline = time.monotonic() + total_budget if total_budget else None
                 
-                # This should never be reached, but just in case
-                raise last_exception
+                for attempt in range(max_retries + 1):
+                    try:
+                        return await func(*args, **kwargs)
+                        
+                    except (OperationalError, DisconnectionError, SQLAlchemyTimeoutError) as e:
+                        delay = cls.backoff_delay(retry_delay, attempt)
+                        if attempt >= max_retries or (deadline is not None and time.monotonic() + delay >= deadline):
+                            logger.error("Async database operation failed after %d attempts: %s", attempt + 1, e)
+                            raise
+                        logger.warning("Async database operation failed (attempt %d/%d): %s", attempt + 1, max_retries + 1, e)
+                        await asyncio.sleep(delay)
                 
             return wrapper
         return decorator
     
     @classmethod
-    def with_deadlock_handling(cls, db: Session, operation: Callable, *args, **kwargs):
+    def with_deadlock_handling(cls, db: Session, operation: Callable[..., T], *args,
+                               total_budget: float = None, cancel_event: threading.Event = None,
+                               **kwargs) -> T:
         """
         Execute operation with deadlock detection and handling
         
+        The failed transaction is rolled back before waiting, so the session
+        holds no pooled connection during the backoff.
+        
         Args:
             db (Session): Database session
             operation (Callable): Operation to execute
             *args: Arguments for the operation
+            total_budget (float): Overall time budget in seconds across all attempts
+            cancel_event (threading.Event): Event that aborts pending retries when set
             **kwargs: Keyword arguments for the operation
             
         Returns:
-            Any: Result of the operation
+            T: Result of the operation
             
         Raises:
             Exception: If operation fails after all retries
         """
         max_attempts = cls.MAX_RETRIES + 1
+        deadline = time.monotonic() + total_budget if total_budget else None
+        attempt = 0
         
-        for attempt in range(max_attempts):
+        while True:
             try:
                 with cls.transaction(db, f"Deadlock-protected operation (attempt {attempt + 1})"):
                     return operation(*args, **kwargs)
                     
-            except IntegrityError as e:
-                # Check if it's a deadlock (SQLite doesn't have deadlocks, but other DBs might)
-                if "deadlock" in str(e).lower() or "lock" in str(e).lower():
-                    if attempt < max_attempts - 1:
-                        delay = cls.DEADLOCK_RETRY_DELAY * (2 ** attempt)
-                        logger.warning(f"Deadlock detected (attempt {attempt + 1}/{max_attempts}): {e}")
-                        logger.info(f"Retrying in {delay:.2f} seconds...")
-                        time.sleep(delay)
-                        continue
-                    else:
-                        logger.error(f"Deadlock persisted after {max_attempts} attempts: {e}")
-                        raise
-                else:
-                    # Non-deadlock integrity error
+            except (IntegrityError, OperationalError) as e:
+                # Non-deadlock database errors are not retried
+                # (SQLite doesn't have deadlocks, but other DBs might)
+                if not _is_deadlock(e):
                     raise
-            except Exception as e:
-                # Non-deadlock error
-                raise
+                
+                if attempt >= max_attempts - 1:
+                    logger.error("Deadlock persisted after %d attempts: %s", max_attempts, e)
+                    raise
+                
+                delay = cls.backoff_delay(cls.DEADLOCK_RETRY_DELAY, attempt)
+                logger.warning("Deadlock detected (attempt %d/%d): %s", attempt + 1, max_attempts, e)
+                if not cls.wait_for_retry(delay, deadline, cancel_event):
+                    logger.error("Deadlock retry budget exhausted after %d attempts: %s", attempt + 1, e)
+                    raise
+            
+            attempt += 1
+    
+    @staticmethod
+    def request_fingerprint(operation: str, arguments: Dict[str, Any]) -> str:
+        """
+        Hash an operation name and its canonicalised arguments
+        
+        Args:
+            operation (str): Qualified name of the operation
+            arguments (Dict[str, Any]): Call arguments (Pydantic models or JSON-serializable values)
+            
+        Returns:
+            str: Hex SHA-256 digest of the canonical JSON payload
+        """
+        payload = {
+            name: value.dict() if hasattr(value, 'dict') else value
+            for name, value in arguments.items()
+        }
+        canonical = json.dumps([operation, payload], sort_keys=True, separators=(',', ':'), default=str)
+        return hashlib.sha256(canonical.encode()).hexdigest()
+    
+    @classmethod
+    def get_idempotent_result(cls, db: Session, key: str, response_type: Any = None,
+                              request_hash: str = None) -> Any:
+        """
+        Look up the stored result of an operation by idempotency key
+        
+        Args:
+            db (Session): Database session
+            key (str): Idempotency key
+            response_type (Any): Pydantic model used to rebuild the stored result
+            request_hash (str): Fingerprint of the current request
+            
+        Returns:
+            Any: Stored result, or None if the key has not been recorded
+            
+        Raises:
+            BusinessLogicError: If the key was recorded for a different request (422)
+        """
+        record = db.get(IdempotencyKey, key)
+        if record is None:
+            return None
+        
+        if request_hash and record.request_hash and record.request_hash != request_hash:
+            logger.warning("Idempotency key %s reused with a different request", key)
+            raise BusinessLogicError(
+                "Idempotency key was already used with a different request",
+                code="IDEMPOTENCY_KEY_MISMATCH",
+                field="Idempotency-Key",
+                status_code=422
+            )
         
-        # This should never be reached
-        raise Exception("Unexpected error in deadlock handling")
+        logger.info("Replaying stored result for idempotency key %s", key)
+        if hasattr(response_type, 'parse_raw'):
+            return response_type.parse_raw(record.response)
+        return json.loads(record.response)
     
     @classmethod
-    def acquire_row_lock(cls, db: Session, table: str, row_id: int, timeout: int = None):
+    def record_idempotent_result(cls, db: Session, key: str, result: Any, request_hash: str = None):
+        """
+        Stage the result of an operation under its idempotency key
+        
+        The record is added to the current transaction, so it commits (or rolls
+        back) together with the operation itself.
+        
+        Args:
+            db (Session): Database session
+            key (str): Idempotency key
+            result (Any): Operation result (Pydantic model or JSON-serializable value)
+            request_hash (str): Fingerprint of the request that produced the result
+        """
+        payload = result.json() if hasattr(result, 'json') else json.dumps(result, default=str)
+        db.add(IdempotencyKey(key=key, response=payload, request_hash=request_hash))
+    
+    @classmethod
+    def purge_idempotency_keys(cls, db: Session, max_age: timedelta = None) -> int:
+        """
+        Delete idempotency keys older than the retention window
+        
+        Args:
+            db (Session): Database session
+            max_age (timedelta): Retention window (defaults to IDEMPOTENCY_KEY_TTL)
+            
+        Returns:
+            int: Number of keys deleted
+        """
+        cutoff = datetime.now(timezone.utc) - (max_age or cls.IDEMPOTENCY_KEY_TTL)
+        
+        with cls.transaction(db, "Purge expired idempotency keys"):
+            deleted = db.query(IdempotencyKey).filter(
+                IdempotencyKey.created_at < cutoff
+            ).delete(synchronize_session=False)
+        
+        logger.info("Purged %d expired idempotency keys", deleted)
+        return deleted
+    
+    @classmethod
+    def acquire_row_lock(cls, db: Session, table: str, row_id: int, timeout: int = None,
+                         nowait: bool = False):
         """
         Acquire a row-level lock for concurrent access control
         
@@ -162,46 +528,140 @@ class TransactionManager:
             table (str): Table name
             row_id (int): Row ID to lock
             timeout (int): Lock timeout in seconds
+            nowait (bool): Fail immediately instead of waiting if the row is locked
+            
+        Raises:
+            ValueError: If the table is not lockable or the row does not exist
             
         Note:
-            This is a placeholder for row-level locking.
-            SQLite doesn't support row-level locks, but this can be implemented
-            for other databases like PostgreSQL or MySQL.
+            On PostgreSQL and MySQL a per-transaction lock wait timeout is set
+            before SELECT ... FOR UPDATE, so contended locks fail fast instead of
+            relying on deadlock detection. SQLite has no row-level locks; the
+            row is only checked for existence.
         """
-        timeout = timeout or cls.LOCK_TIMEOUT
+        if table not in cls.LOCKABLE_TABLES:
+            raise ValueError(f"Row locking is not supported for table {table}")
+        
+        dialect = db.bind.dialect.name
         
-        # For SQLite, we'll use a simple approach
-        # In production with other databases, this would use SELECT ... FOR UPDATE
         try:
-            # Execute a query that would lock the row in other databases
-            result = db.execute(text(f"SELECT id FROM {table} WHERE id = :row_id"), {"row_id": row_id})
+            cls._set_lock_timeout(db, dialect, timeout)
+            
+            result = db.execute(_locking_stmt(table, dialect, nowait), {"row_id": row_id})
             if not result.fetchone():
                 raise ValueError(f"Row {row_id} not found in table {table}")
             
-            logger.debug(f"Row lock acquired for {table}.id = {row_id}")
+            logger.debug("Row lock acquired for %s.id = %s", table, row_id)
             
         except Exception as e:
-            logger.error(f"Failed to acquire row lock for {table}.id = {row_id}: {e}")
+            logger.error("Failed to acquire row lock for %s.id = %s: %s", table, row_id, e)
             raise
     
+    @classmethod
+    def acquire_row_locks(cls, db: Session, table: str, row_ids: Iterable[int], timeout: int = None,
+                          nowait: bool = False) -> List[int]:
+        """
+        Acquire row-level locks on several rows in a globally consistent order
+        
+        Rows are always locked in ascending id order, so two transactions locking
+        overlapping sets of rows cannot deadlock on each other.
+        
+        Args:
+            db (Session): Database session
+            table (str): Table name
+            row_ids (Iterable[int]): Row IDs to lock
+            timeout (int): Lock timeout in seconds
+            nowait (bool): Fail immediately instead of waiting if a row is locked
+            
+        Returns:
+            List[int]: Locked row IDs in lock order
+            
+        Raises:
+            ValueError: If the table is not lockable or any row does not exist
+        """
+        if table not in cls.LOCKABLE_TABLES:
+            raise ValueError(f"Row locking is not supported for table {table}")
+        
+        ids = sorted(set(row_ids))
+        dialect = db.bind.dialect.name
+        
+        if dialect not in ('postgresql', 'mysql'):
+            # No batched FOR UPDATE support; lock one row at a time in sorted order
+            for row_id in ids:
+                cls.acquire_row_lock(db, table, row_id, timeout, nowait)
+            return ids
+        
+        try:
+            cls._set_lock_timeout(db, dialect, timeout)
+            
+            locked = {row[0] for row in db.execute(_batch_locking_stmt(table, dialect, nowait), {"row_ids": ids})}
+            missing = [row_id for row_id in ids if row_id not in locked]
+            if missing:
+                raise ValueError(f"Rows {missing} not found in table {table}")
+            
+            logger.debug("Row locks acquired for %s.id in %s", table, ids)
+            return ids
+            
+        except Exception as e:
+            logger.error("Failed to acquire row locks for %s.id in %s: %s", table, ids, e)
+            raise
+    
+    @classmethod
+    def _set_lock_timeout(cls, db: Session, dialect: str, timeout: int = None):
+        """
+        Set the lock wait timeout for the current transaction where the dialect supports it
+        
+        PostgreSQL scopes the setting to the transaction. MySQL only has a
+        session-level setting, so its previous value is recorded on the
+        connection and restored when the connection is checked back in.
+        
+        Args:
+            db (Session): Database session
+            dialect (str): SQLAlchemy dialect name
+            timeout (int): Lock timeout in seconds
+        """
+        timeout = int(timeout or cls.LOCK_TIMEOUT)
+        if dialect == 'postgresql':
+            db.execute(text("SELECT set_config('lock_timeout', :t, true)"), {"t": f"{timeout * 1000}ms"})
+        elif dialect == 'mysql':
+            connection_info = db.connection().info
+            if _MYSQL_LOCK_TIMEOUT_KEY not in connection_info:
+                connection_info[_MYSQL_LOCK_TIMEOUT_KEY] = db.execute(
+                    text("SELECT @@SESSION.innodb_lock_wait_timeout")
+                ).scalar()
+            db.execute(text(f"SET SESSION innodb_lock_wait_timeout = {timeout}"))
+    
     @classmethod
     def check_connection_health(cls, db: Session) -> bool:
         """
         Check if database connection is healthy
         
+        The result is reused for HEALTH_CHECK_INTERVAL seconds, so frequent
+        callers share one round-trip. Stale pooled connections are already
+        handled by the engine's pool_pre_ping on checkout.
+        
         Args:
             db (Session): Database session
             
         Returns:
             bool: True if connection is healthy, False otherwise
         """
+        cache_key = str(db.bind.url)
+        now = time.monotonic()
+        cached = cls._health_cache.get(cache_key)
+        if cached is not None and now - cached[0] < cls.HEALTH_CHECK_INTERVAL:
+            return cached[1]
+        
         try:
             # Execute a simple query to test connection
             db.execute(text("SELECT 1"))
-            return True
+            healthy = True
         except Exception as e:
-            logger.error(f"Database connection health check failed: {e}")
-            return False
+            logger.error("Database connection health check failed: %s", e)
+            healthy = False
+        
+        cls._health_cache[cache_key] = (now, healthy)
+        return healthy
     
     @classmethod
     def get_transaction_info(cls, db: Session) -> Dict[str, Any]:
@@ -216,65 +676,163 @@ class TransactionManager:
         """
         try:
             # Get transaction isolation level (SQLite specific)
-            result = db.execute(text("PRAGMA journal_mode"))
-            journal_mode = result.fetchone()[0] if result.fetchone() else "unknown"
-            
-            result = db.execute(text("PRAGMA synchronous"))
-            synchronous = result.fetchone()[0] if result.fetchone() else "unknown"
+            cache_key = str(db.bind.url)
+            pragmas = cls._pragma_cache.get(cache_key)
+            if pragmas is None:
+                # Table-valued PRAGMA functions read both settings in one round-trip
+                row = db.execute(text(
+                    "SELECT journal_mode, synchronous FROM pragma_journal_mode(), pragma_synchronous()"
+                )).fetchone()
+                pragmas = {
+                    "journal_mode": row[0] if row else "unknown",
+                    "synchronous": row[1] if row else "unknown"
+                }
+                cls._pragma_cache[cache_key] = pragmas
             
             return {
                 "isolation_level": "SERIALIZABLE",  # SQLite default
-                "journal_mode": journal_mode,
-                "synchronous": synchronous,
+                "journal_mode": pragmas["journal_mode"],
+                "synchronous": pragmas["synchronous"],
                 "is_active": db.is_active,
                 "autoflush": db.autoflush,
                 "autocommit": db.autocommit
             }
         except Exception as e:
-            logger.error(f"Failed to get transaction info: {e}")
+            logger.error("Failed to get transaction info: %s", e)
             return {"error": str(e)}
 
-def atomic_operation(description: str = None):
+def atomic_operation(description: str = None, db_arg: str = "db", read_only: bool = False):
     """
     Decorator for atomic database operations
     
+    The position of the session parameter is resolved once at decoration time.
+    Functions without a parameter named db_arg fall back to scanning the call
+    arguments for a Session.
+    
+    An optional idempotency_key keyword argument makes the operation replay-safe:
+    a previously recorded result is returned without re-executing, and new
+    results are stored in the same transaction as the operation. The key is
+    bound to a fingerprint of the other arguments, so reusing it for a
+    different request is rejected instead of replaying an unrelated result.
+    
+    Read-only operations are returned undecorated: there is nothing to commit
+    or roll back, so no transaction wrapper is added.
+    
+    Coroutine functions are wrapped in TransactionManager.atransaction and
+    expect an AsyncSession; idempotency keys are not supported for them.
+    
     Args:
         description (str): Description of the operation
+        db_arg (str): Name of the parameter holding the database session
+        read_only (bool): Whether the operation only reads from the database
         
     Returns:
         Callable: Decorated function
     """
     def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        def wrapper(*args, **kwargs):
+        if read_only:
+            return func
+        
+        signature = inspect.signature(func)
+        params = list(signature.parameters)
+        db_index = params.index(db_arg) if db_arg in params else None
+        accepts_key = 'idempotency_key' in params
+        response_type = signature.return_annotation
+        op_description = description or f"{func.__name__} operation"
+        
+        def fingerprint(args, kwargs):
+            # Hash every argument except the session and the key itself
+            bound = signature.bind_partial(*args, **kwargs).arguments
+            arguments = {
+                name: value for name, value in bound.items()
+                if name not in (db_arg, 'idempotency_key') and not isinstance(value, _SESSION_TYPES)
+            }
+            return TransactionManager.request_fingerprint(func.__qualname__, arguments)
+        
+        def find_session(args, kwargs):
             # Find database session in arguments
-            db = None
-            for arg in args:
-                if isinstance(arg, Session):
-                    db = arg
-                    break
-            
-            if not db:
-                for value in kwargs.values():
-                    if isinstance(value, Session):
-                        db = value
-                        break
-            
-            if not db:
+            if db_index is not None:
+                db = kwargs.get(db_arg)
+                if db is None and db_index < len(args):
+                    db = args[db_index]
+            else:
+                db = next(
+                    (arg for arg in (*args, *kwargs.values()) if isinstance(arg, _SESSION_TYPES)),
+                    None
+                )
+            
+            if db is None:
                 raise ValueError("Database session not found in function arguments")
+            return db
+        
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                db = find_session(args, kwargs)
+                async with TransactionManager.atransaction(db, op_description):
+                    return await func(*args, **kwargs)
             
-            op_description = description or f"{func.__name__} operation"
+            return async_wrapper
+        
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            idempotency_key = kwargs.get('idempotency_key') if accepts_key else kwargs.pop('idempotency_key', None)
+            db = find_session(args, kwargs)
             
-            with TransactionManager.transaction(db, op_description):
-                return func(*args, **kwargs)
+            request_hash = None
+            if idempotency_key:
+                request_hash = fingerprint(args, kwargs)
+                replay = TransactionManager.get_idempotent_result(db, idempotency_key, response_type, request_hash)
+                if replay is not None:
+                    return replay
+            
+            try:
+                with TransactionManager.transaction(db, op_description):
+                    result = func(*args, **kwargs)
+                    if idempotency_key:
+                        TransactionManager.record_idempotent_result(db, idempotency_key, result, request_hash)
+                    return result
+                    
+            except IntegrityError:
+                # A concurrent request may have committed the same key first
+                if idempotency_key:
+                    replay = TransactionManager.get_idempotent_result(db, idempotency_key, response_type, request_hash)
+                    if replay is not None:
+                        return replay
+                raise
         
         return wrapper
     return decorator
 
-def with_connection_retry(max_retries: int = 3):
+def with_connection_retry(max_retries: int = 3, idempotent: bool = True):
     """
     Decorator for retrying operations on connection failures
     
+    Apply it outside atomic_operation so that each retry runs a fresh
+    transaction rather than retrying inside a failed one.
+    
+    Args:
+        max_retries (int): Maximum number of retry attempts
+        idempotent (bool): Whether the operation is safe to retry without an idempotency key
+        
+    Returns:
+        Callable: Decorated function
+    """
+    def decorator(func: Callable) -> Callable:
+        # Build the retrying wrapper once; with_retry already applies functools.wraps
+        return TransactionManager.with_retry(max_retries, idempotent=idempotent)(func)
+    return decorator
+
+def with_read_retry(max_retries: int = 2):
+    """
+    Decorator for retrying read-only operations on connection failures
+    
+    Unlike with_connection_retry, only connection-level errors are intercepted.
+    Business errors (e.g. ValueError) propagate untouched, without logging or
+    rollback, and the final attempt runs without any exception handling.
+    After a connection-level error the session found in the arguments is
+    rolled back, so the retry does not run inside the failed transaction.
+    
     Args:
         max_retries (int): Maximum number of retry attempts
         
@@ -284,6 +842,20 @@ def with_connection_retry(max_retries: int = 3):
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs):
-            return TransactionManager.with_retry(max_retries)(func)(*args, **kwargs)
+            for attempt in range(max_retries):
+                try:
+                    return func(*args, **kwargs)
+                except (OperationalError, DisconnectionError, SQLAlchemyTimeoutError) as e:
+                    db = next(
+                        (arg for arg in (*args, *kwargs.values()) if isinstance(arg, (Session, scoped_session))),
+                        None
+                    )
+                    if db is not None:
+                        db.rollback()
+                    
+                    delay = TransactionManager.backoff_delay(TransactionManager.RETRY_DELAY, attempt)
+                    logger.warning("Read operation failed (attempt %d/%d): %s", attempt + 1, max_retries + 1, e)
+                    time.sleep(delay)
+            return func(*args, **kwargs)
         return wrapper
-    return decorator 
\ No newline at end of file
+    return decorator
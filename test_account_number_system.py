@@ -3,8 +3,8 @@
 Account Number Generation System Test Script for Bric Pay
 Tests the enhanced account number generation, validation, and analysis features
 """
-import requests
-import json
+import asyncio
+import httpx
 import time
 import sys
 import os
@@ -18,14 +18,24 @@ from src.utils import (
     get_account_number_analysis,
     generate_account_number
 )
+from testing_helpers import RetryTransport
 
 BASE_URL = "http://127.0.0.1:8000/api/v1"
+HEALTH_URL = f"{BASE_URL.replace('/api/v1', '')}/health"
 
-def test_health_check():
+# Shared client settings: a bounded keep-alive pool and retries for transient gateway errors
+CLIENT_LIMITS = httpx.Limits(max_connections=16, max_keepalive_connections=16)
+RETRY_TOTAL = 3
+RETRY_BACKOFF = 0.2  # seconds
+
+# The checks are coroutines that share run_all()'s client, so they are named check_*
+# rather than test_* to keep pytest from collecting them
+
+async def check_health(client):
     """Test health check endpoint"""
     print("🔍 Testing Health Check...")
     try:
-        response = requests.get(f"{BASE_URL.replace('/api/v1', '')}/health")
+        response = await client.get(HEALTH_URL)
         if response.status_code == 200:
             print("✅ Health check passed")
         else:
@@ -33,19 +43,20 @@ def test_health_check():
     except Exception as e:
         print(f"❌ Health check error: {e}")
 
-def test_account_number_generation():
+async def check_account_number_generation(client):
     """Test account number generation with different lengths"""
     print("\n🔍 Testing Account Number Generation...")
     
     test_lengths = [8, 10, 12]
+    responses = await asyncio.gather(
+        *(client.post("/generate-account-number", json={"length": length}) for length in test_lengths),
+        return_exceptions=True
+    )
     
-    for length in test_lengths:
+    for length, response in zip(test_lengths, responses):
         try:
-            response = requests.post(
-                f"{BASE_URL}/generate-account-number",
-                headers={"Content-Type": "application/json"},
-                data=json.dumps({"length": length})
-            )
+            if isinstance(response, Exception):
+                raise response
             
             if response.status_code == 200:
                 data = response.json()
@@ -63,7 +74,7 @@ def test_account_number_generation():
         except Exception as e:
             print(f"❌ Error generating {length}-digit account number: {e}")
 
-def test_account_number_validation():
+async def check_account_number_validation(client):
     """Test account number validation with various inputs"""
     print("\n🔍 Testing Account Number Validation...")
     
@@ -81,28 +92,31 @@ def test_account_number_validation():
         {"account_number": "9876543210", "expected": True, "description": "Valid 10-digit (non-sequential)"},
     ]
     
-    for test_case in test_cases:
-        try:
-            response = requests.post(
-                f"{BASE_URL}/validate-account-number",
-                headers={"Content-Type": "application/json"},
-                data=json.dumps({"account_number": test_case["account_number"]})
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                is_valid = data['is_valid']
-                
-                if is_valid == test_case["expected"]:
-                    print(f"✅ {test_case['description']}: {test_case['account_number']}")
-                else:
-                    print(f"❌ {test_case['description']}: {test_case['account_number']} (expected {test_case['expected']}, got {is_valid})")
-            else:
-                print(f"❌ Validation request failed for {test_case['description']}: {response.status_code}")
-        except Exception as e:
-            print(f"❌ Error testing {test_case['description']}: {e}")
+    # All cases are validated in a single batch request
+    try:
+        response = await client.post(
+            "/batch-validate-account-numbers",
+            json={"account_numbers": [test_case["account_number"] for test_case in test_cases]}
+        )
+        if response.status_code != 200:
+            print(f"❌ Batch validation request failed: {response.status_code}")
+            return
+        results = response.json()['results']
+    except Exception as e:
+        print(f"❌ Error running batch validation: {e}")
+        return
+    
+    expected = [test_case["expected"] for test_case in test_cases]
+    if results == expected:
+        print(f"✅ All {len(test_cases)} validation cases matched")
+    
+    for test_case, is_valid in zip(test_cases, results):
+        if is_valid == test_case["expected"]:
+            print(f"✅ {test_case['description']}: {test_case['account_number']}")
+        else:
+            print(f"❌ {test_case['description']}: {test_case['account_number']} (expected {test_case['expected']}, got {is_valid})")
 
-def test_account_number_analysis():
+async def check_account_number_analysis(client):
     """Test account number analysis functionality"""
     print("\n🔍 Testing Account Number Analysis...")
     
@@ -115,13 +129,16 @@ def test_account_number_analysis():
         "123456789012" # 12-digit
     ]
     
-    for account_number in test_accounts:
+    responses = await asyncio.gather(
+        *(client.post("/analyze-account-number", json={"account_number": account_number})
+          for account_number in test_accounts),
+        return_exceptions=True
+    )
+    
+    for account_number, response in zip(test_accounts, responses):
         try:
-            response = requests.post(
-                f"{BASE_URL}/analyze-account-number",
-                headers={"Content-Type": "application/json"},
-                data=json.dumps({"account_number": account_number})
-            )
+            if isinstance(response, Exception):
+                raise response
             
             if response.status_code == 200:
                 data = response.json()
@@ -142,7 +159,7 @@ def test_account_number_analysis():
         except Exception as e:
             print(f"❌ Error analyzing {account_number}: {e}")
 
-def test_account_creation_with_new_system():
+async def check_account_creation_with_new_system(client):
     """Test account creation with the enhanced account number generation"""
     print("\n🔍 Testing Account Creation with Enhanced System...")
     
@@ -156,11 +173,7 @@ def test_account_creation_with_new_system():
     }
     
     try:
-        response = requests.post(
-            f"{BASE_URL}/create-account",
-            headers={"Content-Type": "application/json"},
-            data=json.dumps(account_data)
-        )
+        response = await client.post("/create-account", json=account_data)
         
         if response.status_code == 201:
             data = response.json()
@@ -184,20 +197,21 @@ def test_account_creation_with_new_system():
         print(f"❌ Error creating account: {e}")
         return None
 
-def test_uniqueness_verification():
+async def check_uniqueness_verification(client):
     """Test that generated account numbers are truly unique"""
     print("\n🔍 Testing Account Number Uniqueness...")
     
     generated_numbers = set()
     num_to_generate = 10
+    responses = await asyncio.gather(
+        *(client.post("/generate-account-number", json={"length": 10}) for _ in range(num_to_generate)),
+        return_exceptions=True
+    )
     
-    for i in range(num_to_generate):
+    for i, response in enumerate(responses):
         try:
-            response = requests.post(
-                f"{BASE_URL}/generate-account-number",
-                headers={"Content-Type": "application/json"},
-                data=json.dumps({"length": 10})
-            )
+            if isinstance(response, Exception):
+                raise response
             
             if response.status_code == 200:
                 data = response.json()
@@ -219,17 +233,13 @@ def test_uniqueness_verification():
     print(f"✅ All {num_to_generate} generated account numbers are unique")
     return True
 
-def test_edge_cases():
+async def check_edge_cases(client):
     """Test edge cases and error handling"""
     print("\n🔍 Testing Edge Cases and Error Handling...")
     
     # Test invalid length
     try:
-        response = requests.post(
-            f"{BASE_URL}/generate-account-number",
-            headers={"Content-Type": "application/json"},
-            data=json.dumps({"length": 5})  # Too short
-        )
+        response = await client.post("/generate-account-number", json={"length": 5})  # Too short
         
         if response.status_code == 400:
             print("✅ Invalid length correctly rejected")
@@ -240,11 +250,7 @@ def test_edge_cases():
     
     # Test missing account number in validation
     try:
-        response = requests.post(
-            f"{BASE_URL}/validate-account-number",
-            headers={"Content-Type": "application/json"},
-            data=json.dumps({})  # Missing account_number
-        )
+        response = await client.post("/validate-account-number", json={})  # Missing account_number
         
         if response.status_code == 400:
             print("✅ Missing account number correctly rejected")
@@ -253,20 +259,21 @@ def test_edge_cases():
     except Exception as e:
         print(f"❌ Error testing missing account number: {e}")
 
-def test_performance():
-    """Test performance of account number generation"""
+async def check_performance(client):
+    """Test performance of concurrent account number generation"""
     print("\n🔍 Testing Performance...")
     
     start_time = time.time()
     num_generations = 5
+    responses = await asyncio.gather(
+        *(client.post("/generate-account-number", json={"length": 10}) for _ in range(num_generations)),
+        return_exceptions=True
+    )
     
-    for i in range(num_generations):
+    for i, response in enumerate(responses):
         try:
-            response = requests.post(
-                f"{BASE_URL}/generate-account-number",
-                headers={"Content-Type": "application/json"},
-                data=json.dumps({"length": 10})
-            )
+            if isinstance(response, Exception):
+                raise response
             
             if response.status_code != 200:
                 print(f"❌ Generation {i+1} failed: {response.status_code}")
@@ -282,19 +289,28 @@ def test_performance():
     print(f"✅ Generated {num_generations} account numbers in {total_time:.2f}s")
     print(f"   Average time per generation: {avg_time:.2f}s")
 
+async def run_all():
+    """Run all account number system tests over one shared keep-alive client"""
+    async with httpx.AsyncClient(
+        base_url=BASE_URL,
+        headers={"Content-Type": "application/json"},
+        transport=RetryTransport(RETRY_TOTAL, RETRY_BACKOFF, limits=CLIENT_LIMITS)
+    ) as client:
+        await check_health(client)
+        await check_account_number_generation(client)
+        await check_account_number_validation(client)
+        await check_account_number_analysis(client)
+        await check_account_creation_with_new_system(client)
+        await check_uniqueness_verification(client)
+        await check_edge_cases(client)
+        await check_performance(client)
+
 def main():
     """Run all account number system tests"""
     print("🔄 Starting Account Number Generation System Tests")
     print("=" * 70)
     
-    test_health_check()
-    test_account_number_generation()
-    test_account_number_validation()
-    test_account_number_analysis()
-    test_account_creation_with_new_system()
-    test_uniqueness_verification()
-    test_edge_cases()
-    test_performance()
+    asyncio.run(run_all())
     
     print("\n" + "=" * 70)
     print("✅ Account Number Generation System Testing Complete!")
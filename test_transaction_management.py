@@ -3,26 +3,107 @@
 Database Transaction Management Test Script for Bric Pay
 Tests the enhanced transaction management, concurrent access handling, and atomic operations
 """
+import atexit
+import httpx
+import itertools
 import requests
-import json
 import time
-import threading
 import sys
 import os
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache, partial
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Add the project root to the Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from testing_helpers import BufferedStdout, capture_output, dumps, parse_json
+
 BASE_URL = "http://127.0.0.1:8000/api/v1"
+CREATE_URL = f"{BASE_URL}/create-account"
+DEPOSIT_URL = f"{BASE_URL}/deposit"
+TRANSFER_URL = f"{BASE_URL}/transfer"
+VALIDATE_URL = f"{BASE_URL}/validate-transfer"
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Test accounts created before the tests run: key -> (name, phone)
+TEST_ACCOUNTS = {
+    "concurrent1": ("Concurrent1", "+5555555555"),
+    "concurrent2": ("Concurrent2", "+5555555556"),
+    "validation1": ("Validation1", "+5555555557"),
+    "validation2": ("Validation2", "+5555555558"),
+    "status": ("StatusTest", "+5555555559"),
+    "atomic1": ("Atomic1", "+5555555560"),
+    "atomic2": ("Atomic2", "+5555555561"),
+    "retry": ("RetryTest", "+5555555562"),
+    "rollback1": ("Rollback1", "+5555555563"),
+    "rollback2": ("Rollback2", "+5555555564"),
+}
+
+# Initial deposits made during setup: key -> amount
+TEST_DEPOSITS = {
+    "concurrent1": 1000.00,
+    "atomic1": 50.00,
+    "rollback1": 200.00,
+}
+
+# Unique phone suffixes, randomly seeded so repeated runs don't collide. The base
+# numbers have 10 digits and phone validation allows at most 15, so suffixes are 4 digits
+_PHONE_SEQ = itertools.count(int.from_bytes(os.urandom(4), 'little'))
+PHONE_SUFFIX_MOD = 10000
+
+# Shared keep-alive session so every request reuses pooled connections.
+# Transient server errors are retried with exponential backoff; only GETs are
+# retried, since replaying a transfer or deposit POST could apply it twice
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=5,
+        backoff_factor=0.05,
+        status_forcelist=[500, 502, 503, 504],
+        allowed_methods=frozenset({"GET"}),
+        raise_on_status=False
+    )
+))
+
+# Shared worker pool for concurrency tests, sized to the connection pool
+POOL = ThreadPoolExecutor(max_workers=16)
+atexit.register(POOL.shutdown)
+
+# Shared httpx client for the concurrent transfers; its connection pool is thread-safe
+HTTPX = httpx.Client(limits=httpx.Limits(max_keepalive_connections=16))
+atexit.register(HTTPX.close)
+
+@lru_cache(maxsize=None)
+def _prepared(method, url):
+    """Build (once per endpoint) a request template with the session's settings applied"""
+    return SESSION.prepare_request(requests.Request(method, url, headers=JSON_HEADERS))
+
+def _get(url):
+    """GET an endpoint through the shared session, reusing its prepared request"""
+    return SESSION.send(_prepared("GET", url).copy(), timeout=5)
+
+def _post(url, payload):
+    """POST a JSON payload through the shared session, reusing the endpoint's prepared request"""
+    prepped = _prepared("POST", url).copy()
+    prepped.body = dumps(payload)
+    prepped.headers["Content-Length"] = str(len(prepped.body))
+    return SESSION.send(prepped, timeout=5)
+
+def _err(response):
+    """Return at most the first 256 bytes of an error response body"""
+    return response.content[:256].decode(errors='replace')
 
 def test_health_check():
     """Test health check endpoint"""
     print("🔍 Testing Health Check...")
     try:
-        response = requests.get(f"{BASE_URL}/health")
+        response = _get(f"{BASE_URL}/health")
         if response.status_code == 200:
-            data = response.json()
+            data = parse_json(response)
             print(f"✅ Health check passed - Status: {data['status']}")
             print(f"   Database connection: {data['database_connection']}")
             return True
@@ -37,13 +118,19 @@ def test_transaction_info():
     """Test transaction information endpoint"""
     print("\n🔍 Testing Transaction Info...")
     try:
-        response = requests.get(f"{BASE_URL}/transaction-info")
+        response = _get(f"{BASE_URL}/transaction-info")
         if response.status_code == 200:
-            data = response.json()
+            data = parse_json(response)
             print("✅ Transaction info retrieved:")
             print(f"   Connection health: {data['connection_health']}")
             print(f"   Isolation level: {data['transaction_info'].get('isolation_level', 'unknown')}")
-            print(f"   Journal mode: {data['transaction_info'].get('journal_mode', 'unknown')}")
+            journal_mode = data['transaction_info'].get('journal_mode')
+            print(f"   Journal mode: {journal_mode or 'unknown'}")
+            # Only a SQLite file database reports a journal mode other than memory;
+            # in-memory SQLite, PostgreSQL and MySQL don't use WAL
+            if journal_mode and str(journal_mode).lower() not in ('memory', 'wal'):
+                print("❌ Expected SQLite WAL journal mode")
+                return False
             return True
         else:
             print(f"❌ Transaction info failed: {response.status_code}")
@@ -52,30 +139,15 @@ def test_transaction_info():
         print(f"❌ Transaction info error: {e}")
         return False
 
-def test_concurrent_transfers():
+# Tests that need accounts are named check_* rather than test_* so pytest doesn't
+# collect them; main() binds their accounts with functools.partial
+
+def check_concurrent_transfers(account1, account2):
     """Test concurrent transfers to verify atomicity and locking"""
     print("\n🔍 Testing Concurrent Transfers...")
     
-    # Create test accounts first
-    account1 = create_test_account("Concurrent1", "+5555555555")
-    account2 = create_test_account("Concurrent2", "+5555555556")
-    
     if not account1 or not account2:
-        print("❌ Failed to create test accounts for concurrent transfer test")
-        return False
-    
-    # Add some balance to account1
-    deposit_response = requests.post(
-        f"{BASE_URL.replace('/api/v1', '/api/v1')}/deposit",
-        headers={"Content-Type": "application/json"},
-        data=json.dumps({
-            "account_number": account1,
-            "amount": 1000.00
-        })
-    )
-    
-    if deposit_response.status_code != 200:
-        print(f"❌ Failed to deposit funds: {deposit_response.status_code}")
+        print("❌ Failed to set up test accounts for concurrent transfer test")
         return False
     
     print(f"✅ Deposited $1000 to account {account1}")
@@ -83,22 +155,18 @@ def test_concurrent_transfers():
     # Define transfer function for concurrent execution
     def make_transfer(transfer_id, amount):
         try:
-            response = requests.post(
-                f"{BASE_URL}/transfer",
-                headers={"Content-Type": "application/json"},
-                data=json.dumps({
-                    "from_account": account1,
-                    "to_account": account2,
-                    "amount": amount
-                })
-            )
+            response = HTTPX.post(TRANSFER_URL, headers=JSON_HEADERS, content=dumps({
+                "from_account": account1,
+                "to_account": account2,
+                "amount": amount
+            }))
             
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json(response)
                 return {
                     "transfer_id": transfer_id,
                     "success": True,
-                    "transfer_id": data.get('transfer_id'),
+                    "server_transfer_id": data.get('transfer_id'),
                     "from_balance": data.get('from_balance'),
                     "to_balance": data.get('to_balance')
                 }
@@ -106,7 +174,7 @@ def test_concurrent_transfers():
                 return {
                     "transfer_id": transfer_id,
                     "success": False,
-                    "error": response.text
+                    "error": _err(response)
                 }
         except Exception as e:
             return {
@@ -118,30 +186,24 @@ def test_concurrent_transfers():
     # Execute 5 concurrent transfers of $50 each
     print("   Executing 5 concurrent transfers of $50 each...")
     
-    with ThreadPoolExecutor(max_workers=5) as executor:
-        futures = [
-            executor.submit(make_transfer, i, 50.00) 
-            for i in range(1, 6)
-        ]
-        
-        results = []
-        for future in as_completed(futures):
-            result = future.result()
-            results.append(result)
-            if result['success']:
-                print(f"   ✅ Transfer {result['transfer_id']} completed")
-            else:
-                print(f"   ❌ Transfer {result['transfer_id']} failed: {result['error']}")
+    futures = [POOL.submit(make_transfer, i, 50.00) for i in range(1, 6)]
     
-    # Check final balances
-    time.sleep(1)  # Wait for all transactions to complete
+    results = []
+    for future in as_completed(futures):
+        result = future.result()
+        results.append(result)
+        if result['success']:
+            print(f"   ✅ Transfer {result['transfer_id']} completed ({result['server_transfer_id']})")
+        else:
+            print(f"   ❌ Transfer {result['transfer_id']} failed: {result['error']}")
     
-    balance1_response = requests.get(f"{BASE_URL}/account/{account1}/balance")
-    balance2_response = requests.get(f"{BASE_URL}/account/{account2}/balance")
+    # Check final balances (every transfer has already returned, so all are committed)
+    balance1_response = _get(f"{BASE_URL}/account/{account1}/balance")
+    balance2_response = _get(f"{BASE_URL}/account/{account2}/balance")
     
     if balance1_response.status_code == 200 and balance2_response.status_code == 200:
-        balance1 = balance1_response.json()['balance']
-        balance2 = balance2_response.json()['balance']
+        balance1 = parse_json(balance1_response)['balance']
+        balance2 = parse_json(balance2_response)['balance']
         
         print(f"   Final balances:")
         print(f"   Account {account1}: ${balance1:.2f}")
@@ -161,32 +223,24 @@ def test_concurrent_transfers():
         print("❌ Failed to get final balances")
         return False
 
-def test_transfer_validation():
+def check_transfer_validation(account1, account2):
     """Test transfer validation endpoint"""
     print("\n🔍 Testing Transfer Validation...")
     
-    # Create test accounts
-    account1 = create_test_account("Validation1", "+5555555557")
-    account2 = create_test_account("Validation2", "+5555555558")
-    
     if not account1 or not account2:
         print("❌ Failed to create test accounts for validation test")
         return False
     
     # Test valid transfer validation
     try:
-        response = requests.post(
-            f"{BASE_URL}/validate-transfer",
-            headers={"Content-Type": "application/json"},
-            data=json.dumps({
-                "from_account": account1,
-                "to_account": account2,
-                "amount": 100.00
-            })
-        )
+        response = _post(VALIDATE_URL, {
+            "from_account": account1,
+            "to_account": account2,
+            "amount": 100.00
+        })
         
         if response.status_code == 200:
-            data = response.json()
+            data = parse_json(response)
             validation = data['validation']
             
             print("✅ Transfer validation response:")
@@ -211,22 +265,19 @@ def test_transfer_validation():
         print(f"❌ Validation test error: {e}")
         return False
 
-def test_concurrent_status():
+def check_concurrent_status(account):
     """Test concurrent status endpoint"""
     print("\n🔍 Testing Concurrent Status...")
     
-    # Create a test account
-    account = create_test_account("StatusTest", "+5555555559")
-    
     if not account:
         print("❌ Failed to create test account for status test")
         return False
     
     try:
-        response = requests.get(f"{BASE_URL}/account/{account}/concurrent-status")
+        response = _get(f"{BASE_URL}/account/{account}/concurrent-status")
         
         if response.status_code == 200:
-            data = response.json()
+            data = parse_json(response)
             print("✅ Concurrent status retrieved:")
             print(f"   Account: {data['account_number']}")
             print(f"   Active transactions (last minute): {data['active_transactions_last_minute']}")
@@ -241,56 +292,34 @@ def test_concurrent_status():
         print(f"❌ Concurrent status error: {e}")
         return False
 
-def test_insufficient_balance_atomicity():
+def check_insufficient_balance_atomicity(account1, account2):
     """Test that insufficient balance transfers are properly rolled back"""
     print("\n🔍 Testing Insufficient Balance Atomicity...")
     
-    # Create test accounts
-    account1 = create_test_account("Atomic1", "+5555555560")
-    account2 = create_test_account("Atomic2", "+5555555561")
-    
     if not account1 or not account2:
-        print("❌ Failed to create test accounts for atomicity test")
-        return False
-    
-    # Add small balance to account1
-    deposit_response = requests.post(
-        f"{BASE_URL.replace('/api/v1', '/api/v1')}/deposit",
-        headers={"Content-Type": "application/json"},
-        data=json.dumps({
-            "account_number": account1,
-            "amount": 50.00
-        })
-    )
-    
-    if deposit_response.status_code != 200:
-        print(f"❌ Failed to deposit funds: {deposit_response.status_code}")
+        print("❌ Failed to set up test accounts for atomicity test")
         return False
     
     print(f"✅ Deposited $50 to account {account1}")
     
     # Try to transfer more than available balance
     try:
-        response = requests.post(
-            f"{BASE_URL}/transfer",
-            headers={"Content-Type": "application/json"},
-            data=json.dumps({
-                "from_account": account1,
-                "to_account": account2,
-                "amount": 100.00  # More than available balance
-            })
-        )
+        response = _post(TRANSFER_URL, {
+            "from_account": account1,
+            "to_account": account2,
+            "amount": 100.00  # More than available balance
+        })
         
         if response.status_code == 400:
             print("✅ Insufficient balance transfer properly rejected")
             
             # Check that balances are unchanged
-            balance1_response = requests.get(f"{BASE_URL}/account/{account1}/balance")
-            balance2_response = requests.get(f"{BASE_URL}/account/{account2}/balance")
+            balance1_response = _get(f"{BASE_URL}/account/{account1}/balance")
+            balance2_response = _get(f"{BASE_URL}/account/{account2}/balance")
             
             if balance1_response.status_code == 200 and balance2_response.status_code == 200:
-                balance1 = balance1_response.json()['balance']
-                balance2 = balance2_response.json()['balance']
+                balance1 = parse_json(balance1_response)['balance']
+                balance2 = parse_json(balance2_response)['balance']
                 
                 print(f"   Account {account1} balance: ${balance1:.2f} (unchanged)")
                 print(f"   Account {account2} balance: ${balance2:.2f} (unchanged)")
@@ -311,15 +340,13 @@ def test_insufficient_balance_atomicity():
         print(f"❌ Atomicity test error: {e}")
         return False
 
-def test_database_connection_retry():
+def check_database_connection_retry(account):
     """Test database connection retry mechanism"""
     print("\n🔍 Testing Database Connection Retry...")
     
     # This test simulates connection issues by making multiple rapid requests
     # The retry mechanism should handle temporary connection issues
     
-    account = create_test_account("RetryTest", "+5555555562")
-    
     if not account:
         print("❌ Failed to create test account for retry test")
         return False
@@ -327,19 +354,20 @@ def test_database_connection_retry():
     # Make multiple rapid balance checks to test retry mechanism
     print("   Making 10 rapid balance checks...")
     
+    # Transient failures are retried by the shared session, so every check must succeed.
+    # The checks run on this thread: the test itself already occupies a POOL worker,
+    # and waiting on nested POOL tasks could exhaust the pool
     successful_checks = 0
     for i in range(10):
         try:
-            response = requests.get(f"{BASE_URL}/account/{account}/balance")
-            if response.status_code == 200:
+            if _get(f"{BASE_URL}/account/{account}/balance").status_code == 200:
                 successful_checks += 1
-            time.sleep(0.1)  # Small delay between requests
         except Exception as e:
             print(f"   Check {i+1} failed: {e}")
     
     print(f"   Successful checks: {successful_checks}/10")
     
-    if successful_checks >= 8:  # Allow some failures due to rapid requests
+    if successful_checks == 10:
         print("   ✅ Connection retry mechanism working")
         return True
     else:
@@ -349,9 +377,8 @@ def test_database_connection_retry():
 def create_test_account(name, phone):
     """Helper function to create a test account"""
     try:
-        # Add timestamp to make phone numbers unique
-        import time
-        unique_phone = f"{phone}_{int(time.time() * 1000) % 10000}"
+        # Add a sequence number to make phone numbers unique
+        unique_phone = f"{phone}_{next(_PHONE_SEQ) % PHONE_SUFFIX_MOD:04d}"
         
         account_data = {
             "name": name,
@@ -362,14 +389,10 @@ def create_test_account(name, phone):
             "place_of_birth": "Test City"
         }
         
-        response = requests.post(
-            f"{BASE_URL.replace('/api/v1', '/api/v1')}/create-account",
-            headers={"Content-Type": "application/json"},
-            data=json.dumps(account_data)
-        )
+        response = _post(CREATE_URL, account_data)
         
         if response.status_code == 201:
-            return response.json()['account_number']
+            return parse_json(response)['account_number']
         else:
             print(f"Failed to create test account: {response.status_code}")
             return None
@@ -377,54 +400,51 @@ def create_test_account(name, phone):
         print(f"Error creating test account: {e}")
         return None
 
-def test_transaction_rollback():
+def setup_test_account(key):
+    """Create a test account and make its initial deposit, if one is configured"""
+    account_number = create_test_account(*TEST_ACCOUNTS[key])
+    amount = TEST_DEPOSITS.get(key)
+    if account_number and amount is not None:
+        deposit_response = _post(DEPOSIT_URL, {
+            "account_number": account_number,
+            "amount": amount
+        })
+        if deposit_response.status_code != 200:
+            print(f"Failed to deposit funds: {deposit_response.status_code}")
+            return None
+    return account_number
+
+def create_test_accounts():
+    """Create and fund every test account up front, concurrently on the shared pool"""
+    keys = list(TEST_ACCOUNTS)
+    return dict(zip(keys, POOL.map(setup_test_account, keys)))
+
+def check_transaction_rollback(account1, account2):
     """Test transaction rollback on errors"""
     print("\n🔍 Testing Transaction Rollback...")
     
-    # Create test accounts
-    account1 = create_test_account("Rollback1", "+5555555563")
-    account2 = create_test_account("Rollback2", "+5555555564")
-    
     if not account1 or not account2:
-        print("❌ Failed to create test accounts for rollback test")
-        return False
-    
-    # Add balance to account1
-    deposit_response = requests.post(
-        f"{BASE_URL.replace('/api/v1', '/api/v1')}/deposit",
-        headers={"Content-Type": "application/json"},
-        data=json.dumps({
-            "account_number": account1,
-            "amount": 200.00
-        })
-    )
-    
-    if deposit_response.status_code != 200:
-        print(f"❌ Failed to deposit funds: {deposit_response.status_code}")
+        print("❌ Failed to set up test accounts for rollback test")
         return False
     
     print(f"✅ Deposited $200 to account {account1}")
     
     # Try to transfer to non-existent account (should rollback)
     try:
-        response = requests.post(
-            f"{BASE_URL}/transfer",
-            headers={"Content-Type": "application/json"},
-            data=json.dumps({
-                "from_account": account1,
-                "to_account": "9999999999",  # Non-existent account
-                "amount": 100.00
-            })
-        )
+        response = _post(TRANSFER_URL, {
+            "from_account": account1,
+            "to_account": "9999999999",  # Non-existent account
+            "amount": 100.00
+        })
         
         if response.status_code == 400:
             print("✅ Transfer to non-existent account properly rejected")
             
             # Check that source account balance is unchanged
-            balance_response = requests.get(f"{BASE_URL}/account/{account1}/balance")
+            balance_response = _get(f"{BASE_URL}/account/{account1}/balance")
             
             if balance_response.status_code == 200:
-                balance = balance_response.json()['balance']
+                balance = parse_json(balance_response)['balance']
                 print(f"   Account {account1} balance: ${balance:.2f} (unchanged)")
                 
                 if balance == 200.00:
@@ -443,34 +463,67 @@ def test_transaction_rollback():
         print(f"❌ Rollback test error: {e}")
         return False
 
+def _safe_run(test_name, test_func):
+    """Run a single test, reporting failures instead of raising; returns (name, passed, elapsed seconds)"""
+    start = time.perf_counter()
+    passed = False
+    try:
+        passed = bool(test_func())
+        if not passed:
+            print(f"❌ {test_name} failed")
+    except Exception as e:
+        print(f"❌ {test_name} failed with exception: {e}")
+    return test_name, passed, time.perf_counter() - start
+
+def _run_buffered(test):
+    """Run a (name, callable) test with its output captured; returns (result row, output)"""
+    test_name, test_func = test
+    with capture_output() as buffer:
+        row = _safe_run(test_name, test_func)
+    return row, buffer.getvalue()
+
 def main():
     """Run all transaction management tests"""
     print("🔄 Starting Database Transaction Management Tests")
     print("=" * 70)
     
-    # Run all tests
-    tests = [
+    # Create and fund all test accounts in parallel before running the tests
+    accounts = create_test_accounts()
+    
+    # Tests with no ordering dependency on each other run concurrently
+    independent_tests = [
         ("Health Check", test_health_check),
         ("Transaction Info", test_transaction_info),
-        ("Concurrent Transfers", test_concurrent_transfers),
-        ("Transfer Validation", test_transfer_validation),
-        ("Concurrent Status", test_concurrent_status),
-        ("Insufficient Balance Atomicity", test_insufficient_balance_atomicity),
-        ("Database Connection Retry", test_database_connection_retry),
-        ("Transaction Rollback", test_transaction_rollback)
+        ("Transfer Validation", partial(check_transfer_validation, accounts["validation1"], accounts["validation2"])),
+        ("Concurrent Status", partial(check_concurrent_status, accounts["status"])),
+        ("Database Connection Retry", partial(check_database_connection_retry, accounts["retry"]))
     ]
     
-    passed_tests = 0
-    total_tests = len(tests)
+    # Tests that exercise balances and rollbacks run one at a time
+    sequential_tests = [
+        ("Concurrent Transfers", partial(check_concurrent_transfers, accounts["concurrent1"], accounts["concurrent2"])),
+        ("Insufficient Balance Atomicity", partial(check_insufficient_balance_atomicity, accounts["atomic1"], accounts["atomic2"])),
+        ("Transaction Rollback", partial(check_transaction_rollback, accounts["rollback1"], accounts["rollback2"]))
+    ]
     
-    for test_name, test_func in tests:
-        try:
-            if test_func():
-                passed_tests += 1
-            else:
-                print(f"❌ {test_name} failed")
-        except Exception as e:
-            print(f"❌ {test_name} failed with exception: {e}")
+    total_tests = len(independent_tests) + len(sequential_tests)
+    
+    # Buffer each concurrent test's output and print it in order once all have finished
+    sys.stdout = BufferedStdout(sys.stdout)
+    try:
+        results = list(POOL.map(_run_buffered, independent_tests))
+    finally:
+        sys.stdout = sys.stdout.stream
+    
+    rows = []
+    for row, output in results:
+        print(output, end="")
+        rows.append(row)
+    
+    for test_name, test_func in sequential_tests:
+        rows.append(_safe_run(test_name, test_func))
+    
+    passed_tests = sum(passed for _, passed, _ in rows)
     
     print("\n" + "=" * 70)
     print(f"✅ Transaction Management Testing Complete!")
@@ -481,6 +534,11 @@ def main():
     else:
         print(f"⚠️  {total_tests - passed_tests} tests failed")
     
+    # Per-test timings, slowest first
+    print("\n⏱️  Test timings:")
+    for test_name, passed, elapsed in sorted(rows, key=lambda row: row[2], reverse=True):
+        print(f"   {'✅' if passed else '❌'} {test_name:<32} {elapsed * 1000:8.1f} ms")
+    
     print("\n📋 Enhanced Transaction Management Features Verified:")
     print("   • Atomic database operations with automatic rollback")
     print("   • Concurrent access handling with thread locks")
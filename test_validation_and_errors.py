@@ -4,14 +4,32 @@ Comprehensive Test Script for Task 6: Input Validation and Error Handling
 Tests all validation rules, error handling, and edge cases
 """
 
-import requests
-import json
-import time
-from typing import Dict, Any
+import asyncio
+import httpx
+import itertools
+import os
+import sys
+from collections import namedtuple
+from functools import partial
+from typing import Dict, Any, List
+
+from testing_helpers import BufferedStdout, RetryTransport, capture_output, dumps, parse_json
 
 # Configuration
 BASE_URL = "http://localhost:5000"
 API_BASE = f"{BASE_URL}/api/v1"
+HEALTH_URL = f"{BASE_URL}/health"
+
+# Unique phone suffixes, randomly seeded so repeated runs don't collide. The base
+# numbers have 10 digits and phone validation allows at most 15, so suffixes are 4 digits
+_PHONE_SEQ = itertools.count(int.from_bytes(os.urandom(4), 'little'))
+PHONE_SUFFIX_MOD = 10000
+
+# Shared client settings: a keep-alive pool large enough for the concurrent case
+# fan-out, and retries for transient gateway errors
+CLIENT_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=64)
+RETRY_TOTAL = 2
+RETRY_BACKOFF = 0.1  # seconds
 
 def print_test_result(test_name: str, success: bool, details: str = ""):
     """Print test result with formatting"""
@@ -21,12 +39,68 @@ def print_test_result(test_name: str, success: bool, details: str = ""):
         print(f"   {details}")
     print()
 
-def test_health_check():
+def _check_is_valid(response, test_case):
+    """Compare a validation endpoint's is_valid flag with the case; returns (ok, detail)"""
+    if response.status_code != 200:
+        return False, f"HTTP {response.status_code}"
+    
+    is_valid = parse_json(response).get('is_valid', False)
+    if is_valid == test_case.expected:
+        return True, ""
+    return False, f"Expected {test_case.expected}, got {is_valid}"
+
+def _check_status(response, test_case):
+    """Compare the response status code with the case; returns (ok, detail)"""
+    if response.status_code == test_case.expected:
+        return True, ""
+    return False, f"Expected {test_case.expected}, got {response.status_code}"
+
+# Outcome of a single case; detail explains a failure
+CaseResult = namedtuple("CaseResult", "name ok detail")
+
+async def _send_case(client, method, path, body, test_case, check):
+    """Send one case's request with an optional JSON body and check the response; returns a CaseResult"""
+    try:
+        if method == "POST":
+            response = await client.post(path, content=body)
+        else:
+            response = await client.get(path)
+        ok, detail = check(response, test_case)
+    except Exception as e:
+        ok, detail = False, f"Error {e}"
+    return CaseResult(test_case.description, ok, detail)
+
+def _report_cases(test_name, results: List[CaseResult]):
+    """Write the failed cases, in case order, and the test's result in a single write; returns True if all passed"""
+    lines = [f"   ❌ {result.name}: {result.detail}" for result in results if not result.ok]
+    success_count = len(results) - len(lines)
+    success = success_count == len(results)
+    
+    status = "✅ PASS" if success else "❌ FAIL"
+    lines += [f"{status} {test_name}", f"   {success_count}/{len(results)} tests passed", ""]
+    sys.stdout.write("\n".join(lines) + "\n")
+    return success
+
+async def _run_cases(client, test_name, cases, bodies, check, endpoint=None):
+    """Send every case concurrently and report the results; returns True if all passed.
+    Cases go to endpoint, or to their own endpoint with their own method when it is None"""
+    results = await asyncio.gather(*(
+        _send_case(
+            client, getattr(test_case, "method", "POST"), endpoint or test_case.endpoint, body, test_case, check
+        )
+        for test_case, body in zip(cases, bodies)
+    ))
+    return _report_cases(test_name, results)
+
+# The checks are coroutines that share run_all()'s client, so they are named check_*
+# rather than test_* to keep pytest from collecting them
+
+async def check_health(client):
     """Test basic health check"""
     print("Testing Health Check...")
     
     try:
-        response = requests.get(f"{BASE_URL}/health")
+        response = await client.get(HEALTH_URL)
         success = response.status_code == 200
         print_test_result("Health Check", success, f"Status: {response.status_code}")
         return success
@@ -34,16 +108,16 @@ def test_health_check():
         print_test_result("Health Check", False, f"Error: {e}")
         return False
 
-def test_validation_rules():
+async def check_validation_rules(client):
     """Test validation rules endpoint"""
     print("Testing Validation Rules...")
     
     try:
-        response = requests.get(f"{API_BASE}/validation-rules")
+        response = await client.get("/validation-rules")
         success = response.status_code == 200
         
         if success:
-            data = response.json()
+            data = parse_json(response)
             rules = data.get('validation_rules', {})
             rule_count = len(rules)
             print_test_result("Validation Rules", success, f"Retrieved {rule_count} rule sets")
@@ -55,226 +129,108 @@ def test_validation_rules():
         print_test_result("Validation Rules", False, f"Error: {e}")
         return False
 
-def test_phone_validation():
+PhoneCase = namedtuple("PhoneCase", "phone expected description")
+
+PHONE_CASES = (
+    PhoneCase("+1234567890", True, "Valid US number"),
+    PhoneCase("+44123456789", True, "Valid UK number"),
+    PhoneCase("1234567890", False, "Missing country code"),
+    PhoneCase("+123456789", False, "Too short"),
+    PhoneCase("+123456789012345", False, "Too long"),
+    PhoneCase("+0000000000", False, "All zeros"),
+    PhoneCase("+1111111111", False, "All ones"),
+    PhoneCase("+1abc123456", False, "Contains letters"),
+    PhoneCase("", False, "Empty string"),
+)
+PHONE_BODIES = tuple(dumps({"phone": test_case.phone}) for test_case in PHONE_CASES)
+
+async def check_phone_validation(client):
     """Test phone number validation"""
     print("Testing Phone Number Validation...")
     
-    test_cases = [
-        {"phone": "+1234567890", "expected": True, "description": "Valid US number"},
-        {"phone": "+44123456789", "expected": True, "description": "Valid UK number"},
-        {"phone": "1234567890", "expected": False, "description": "Missing country code"},
-        {"phone": "+123456789", "expected": False, "description": "Too short"},
-        {"phone": "+123456789012345", "expected": False, "description": "Too long"},
-        {"phone": "+0000000000", "expected": False, "description": "All zeros"},
-        {"phone": "+1111111111", "expected": False, "description": "All ones"},
-        {"phone": "+1abc123456", "expected": False, "description": "Contains letters"},
-        {"phone": "", "expected": False, "description": "Empty string"},
-    ]
-    
-    success_count = 0
-    
-    for test_case in test_cases:
-        try:
-            response = requests.post(
-                f"{API_BASE}/validate-phone",
-                headers={"Content-Type": "application/json"},
-                data=json.dumps({"phone": test_case["phone"]})
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                is_valid = data.get('is_valid', False)
-                success = is_valid == test_case["expected"]
-                
-                if success:
-                    success_count += 1
-                else:
-                    print(f"   ❌ {test_case['description']}: Expected {test_case['expected']}, got {is_valid}")
-            else:
-                print(f"   ❌ {test_case['description']}: HTTP {response.status_code}")
-                
-        except Exception as e:
-            print(f"   ❌ {test_case['description']}: Error {e}")
-    
-    print_test_result("Phone Validation", success_count == len(test_cases), f"{success_count}/{len(test_cases)} tests passed")
-    return success_count == len(test_cases)
+    return await _run_cases(client, "Phone Validation", PHONE_CASES, PHONE_BODIES, _check_is_valid, "/validate-phone")
+
+PasswordCase = namedtuple("PasswordCase", "password expected description")
 
-def test_password_validation():
+PASSWORD_CASES = (
+    PasswordCase("SecurePass123!", True, "Strong password"),
+    PasswordCase("weak", False, "Too short"),
+    PasswordCase("nouppercase123!", False, "No uppercase"),
+    PasswordCase("NOLOWERCASE123!", False, "No lowercase"),
+    PasswordCase("NoDigits!", False, "No digits"),
+    PasswordCase("NoSpecial123", False, "No special chars"),
+    PasswordCase("password123!", False, "Common word"),
+    PasswordCase("123456789!", False, "Sequential numbers"),
+    PasswordCase("MySecurePass123!", True, "Very strong password"),
+)
+PASSWORD_BODIES = tuple(dumps({"password": test_case.password}) for test_case in PASSWORD_CASES)
+
+async def check_password_validation(client):
     """Test password strength validation"""
     print("Testing Password Validation...")
     
-    test_cases = [
-        {"password": "SecurePass123!", "expected": True, "description": "Strong password"},
-        {"password": "weak", "expected": False, "description": "Too short"},
-        {"password": "nouppercase123!", "expected": False, "description": "No uppercase"},
-        {"password": "NOLOWERCASE123!", "expected": False, "description": "No lowercase"},
-        {"password": "NoDigits!", "expected": False, "description": "No digits"},
-        {"password": "NoSpecial123", "expected": False, "description": "No special chars"},
-        {"password": "password123!", "expected": False, "description": "Common word"},
-        {"password": "123456789!", "expected": False, "description": "Sequential numbers"},
-        {"password": "MySecurePass123!", "expected": True, "description": "Very strong password"},
-    ]
-    
-    success_count = 0
-    
-    for test_case in test_cases:
-        try:
-            response = requests.post(
-                f"{API_BASE}/validate-password",
-                headers={"Content-Type": "application/json"},
-                data=json.dumps({"password": test_case["password"]})
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                is_valid = data.get('is_valid', False)
-                success = is_valid == test_case["expected"]
-                
-                if success:
-                    success_count += 1
-                else:
-                    print(f"   ❌ {test_case['description']}: Expected {test_case['expected']}, got {is_valid}")
-            else:
-                print(f"   ❌ {test_case['description']}: HTTP {response.status_code}")
-                
-        except Exception as e:
-            print(f"   ❌ {test_case['description']}: Error {e}")
-    
-    print_test_result("Password Validation", success_count == len(test_cases), f"{success_count}/{len(test_cases)} tests passed")
-    return success_count == len(test_cases)
+    return await _run_cases(client, "Password Validation", PASSWORD_CASES, PASSWORD_BODIES, _check_is_valid, "/validate-password")
+
+AccountCase = namedtuple("AccountCase", "account_number expected description")
+
+ACCOUNT_CASES = (
+    AccountCase("1234567890", True, "Valid 10-digit"),
+    AccountCase("12345678", True, "Valid 8-digit"),
+    AccountCase("123456789012", True, "Valid 12-digit"),
+    AccountCase("0123456789", False, "Leading zero"),
+    AccountCase("1234567", False, "Too short"),
+    AccountCase("1234567890123", False, "Too long"),
+    AccountCase("123456789a", False, "Contains letters"),
+    AccountCase("", False, "Empty string"),
+)
+ACCOUNT_BODIES = tuple(dumps({"account_number": test_case.account_number}) for test_case in ACCOUNT_CASES)
 
-def test_account_validation():
+async def check_account_validation(client):
     """Test account number validation"""
     print("Testing Account Number Validation...")
     
-    test_cases = [
-        {"account_number": "1234567890", "expected": True, "description": "Valid 10-digit"},
-        {"account_number": "12345678", "expected": True, "description": "Valid 8-digit"},
-        {"account_number": "123456789012", "expected": True, "description": "Valid 12-digit"},
-        {"account_number": "0123456789", "expected": False, "description": "Leading zero"},
-        {"account_number": "1234567", "expected": False, "description": "Too short"},
-        {"account_number": "1234567890123", "expected": False, "description": "Too long"},
-        {"account_number": "123456789a", "expected": False, "description": "Contains letters"},
-        {"account_number": "", "expected": False, "description": "Empty string"},
-    ]
-    
-    success_count = 0
-    
-    for test_case in test_cases:
-        try:
-            response = requests.post(
-                f"{API_BASE}/validate-account",
-                headers={"Content-Type": "application/json"},
-                data=json.dumps({"account_number": test_case["account_number"]})
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                is_valid = data.get('is_valid', False)
-                success = is_valid == test_case["expected"]
-                
-                if success:
-                    success_count += 1
-                else:
-                    print(f"   ❌ {test_case['description']}: Expected {test_case['expected']}, got {is_valid}")
-            else:
-                print(f"   ❌ {test_case['description']}: HTTP {response.status_code}")
-                
-        except Exception as e:
-            print(f"   ❌ {test_case['description']}: Error {e}")
-    
-    print_test_result("Account Validation", success_count == len(test_cases), f"{success_count}/{len(test_cases)} tests passed")
-    return success_count == len(test_cases)
+    return await _run_cases(client, "Account Validation", ACCOUNT_CASES, ACCOUNT_BODIES, _check_is_valid, "/validate-account")
+
+AmountCase = namedtuple("AmountCase", "amount expected description")
+
+AMOUNT_CASES = (
+    AmountCase(100.50, True, "Valid amount"),
+    AmountCase(0.01, True, "Minimum amount"),
+    AmountCase(1000000, True, "Maximum amount"),
+    AmountCase(0, False, "Zero amount"),
+    AmountCase(-100, False, "Negative amount"),
+    AmountCase(1000001, False, "Above maximum"),
+    AmountCase(0.001, False, "Below minimum"),
+    AmountCase("invalid", False, "Invalid string"),
+)
+AMOUNT_BODIES = tuple(dumps({"amount": test_case.amount}) for test_case in AMOUNT_CASES)
 
-def test_amount_validation():
+async def check_amount_validation(client):
     """Test amount validation"""
     print("Testing Amount Validation...")
     
-    test_cases = [
-        {"amount": 100.50, "expected": True, "description": "Valid amount"},
-        {"amount": 0.01, "expected": True, "description": "Minimum amount"},
-        {"amount": 1000000, "expected": True, "description": "Maximum amount"},
-        {"amount": 0, "expected": False, "description": "Zero amount"},
-        {"amount": -100, "expected": False, "description": "Negative amount"},
-        {"amount": 1000001, "expected": False, "description": "Above maximum"},
-        {"amount": 0.001, "expected": False, "description": "Below minimum"},
-        {"amount": "invalid", "expected": False, "description": "Invalid string"},
-    ]
-    
-    success_count = 0
-    
-    for test_case in test_cases:
-        try:
-            response = requests.post(
-                f"{API_BASE}/validate-amount",
-                headers={"Content-Type": "application/json"},
-                data=json.dumps({"amount": test_case["amount"]})
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                is_valid = data.get('is_valid', False)
-                success = is_valid == test_case["expected"]
-                
-                if success:
-                    success_count += 1
-                else:
-                    print(f"   ❌ {test_case['description']}: Expected {test_case['expected']}, got {is_valid}")
-            else:
-                print(f"   ❌ {test_case['description']}: HTTP {response.status_code}")
-                
-        except Exception as e:
-            print(f"   ❌ {test_case['description']}: Error {e}")
-    
-    print_test_result("Amount Validation", success_count == len(test_cases), f"{success_count}/{len(test_cases)} tests passed")
-    return success_count == len(test_cases)
+    return await _run_cases(client, "Amount Validation", AMOUNT_CASES, AMOUNT_BODIES, _check_is_valid, "/validate-amount")
+
+FieldCase = namedtuple("FieldCase", "field_name value expected description")
+
+FIELD_CASES = (
+    FieldCase("phone", "+1234567890", True, "Phone field"),
+    FieldCase("password", "SecurePass123!", True, "Password field"),
+    FieldCase("account_number", "1234567890", True, "Account field"),
+    FieldCase("name", "John Doe", True, "Name field"),
+    FieldCase("amount", "100.50", True, "Amount field"),
+    FieldCase("unknown", "test", True, "Unknown field"),
+    FieldCase("test", "", False, "Empty value"),
+)
+FIELD_BODIES = tuple(dumps({"field_name": test_case.field_name, "value": test_case.value}) for test_case in FIELD_CASES)
 
-def test_field_validation():
+async def check_field_validation(client):
     """Test generic field validation"""
     print("Testing Generic Field Validation...")
     
-    test_cases = [
-        {"field_name": "phone", "value": "+1234567890", "expected": True, "description": "Phone field"},
-        {"field_name": "password", "value": "SecurePass123!", "expected": True, "description": "Password field"},
-        {"field_name": "account_number", "value": "1234567890", "expected": True, "description": "Account field"},
-        {"field_name": "name", "value": "John Doe", "expected": True, "description": "Name field"},
-        {"field_name": "amount", "value": "100.50", "expected": True, "description": "Amount field"},
-        {"field_name": "unknown", "value": "test", "expected": True, "description": "Unknown field"},
-        {"field_name": "test", "value": "", "expected": False, "description": "Empty value"},
-    ]
-    
-    success_count = 0
-    
-    for test_case in test_cases:
-        try:
-            response = requests.post(
-                f"{API_BASE}/validate-field",
-                headers={"Content-Type": "application/json"},
-                data=json.dumps({
-                    "field_name": test_case["field_name"],
-                    "value": test_case["value"]
-                })
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                is_valid = data.get('is_valid', False)
-                success = is_valid == test_case["expected"]
-                
-                if success:
-                    success_count += 1
-                else:
-                    print(f"   ❌ {test_case['description']}: Expected {test_case['expected']}, got {is_valid}")
-            else:
-                print(f"   ❌ {test_case['description']}: HTTP {response.status_code}")
-                
-        except Exception as e:
-            print(f"   ❌ {test_case['description']}: Error {e}")
-    
-    print_test_result("Field Validation", success_count == len(test_cases), f"{success_count}/{len(test_cases)} tests passed")
-    return success_count == len(test_cases)
+    return await _run_cases(client, "Field Validation", FIELD_CASES, FIELD_BODIES, _check_is_valid, "/validate-field")
 
-def test_account_creation_validation():
+async def check_account_creation_validation(client):
     """Test account creation with various validation scenarios"""
     print("Testing Account Creation Validation...")
     
@@ -353,78 +309,46 @@ def test_account_creation_validation():
         },
     ]
     
-    success_count = 0
+    results = []
     
-    for i, test_case in enumerate(test_cases):
+    for test_case in test_cases:
         try:
-            # Add timestamp to phone to avoid conflicts
-            import time
+            # Add a sequence number to phone to avoid conflicts
             test_data = test_case["data"].copy()
-            test_data["phone"] = f"{test_data['phone']}_{int(time.time() * 1000) % 10000}"
+            test_data["phone"] = f"{test_data['phone']}_{next(_PHONE_SEQ) % PHONE_SUFFIX_MOD:04d}"
             
-            response = requests.post(
-                f"{API_BASE}/create-account",
-                headers={"Content-Type": "application/json"},
-                data=json.dumps(test_data)
+            response = await client.post(
+                "/create-account",
+                content=dumps(test_data)
             )
             
             success = response.status_code == test_case["expected"]
+            detail = ""
             
-            if success:
-                success_count += 1
-            else:
-                print(f"   ❌ {test_case['description']}: Expected {test_case['expected']}, got {response.status_code}")
-                if response.status_code != test_case["expected"]:
-                    try:
-                        error_data = response.json()
-                        print(f"      Error: {error_data.get('error', 'Unknown error')}")
-                    except:
-                        pass
+            if not success:
+                detail = f"Expected {test_case['expected']}, got {response.status_code}"
+                try:
+                    error_data = parse_json(response)
+                    detail += f"\n      Error: {error_data.get('error', 'Unknown error')}"
+                except:
+                    pass
+            results.append(CaseResult(test_case["description"], success, detail))
                 
         except Exception as e:
-            print(f"   ❌ {test_case['description']}: Error {e}")
+            results.append(CaseResult(test_case["description"], False, f"Error {e}"))
     
-    print_test_result("Account Creation Validation", success_count == len(test_cases), f"{success_count}/{len(test_cases)} tests passed")
-    return success_count == len(test_cases)
+    return _report_cases("Account Creation Validation", results)
 
-def test_deposit_validation():
+async def check_deposit_validation(client, accounts):
     """Test deposit validation"""
     print("Testing Deposit Validation...")
     
-    # First create a test account
-    test_account = None
-    try:
-        account_data = {
-            "name": "Test",
-            "surname": "User",
-            "phone": f"+1234567890_{int(time.time() * 1000) % 10000}",
-            "password": "SecurePass123!",
-            "date_of_birth": "1990-01-01",
-            "place_of_birth": "Test City"
-        }
-        
-        response = requests.post(
-            f"{API_BASE}/create-account",
-            headers={"Content-Type": "application/json"},
-            data=json.dumps(account_data)
-        )
-        
-        if response.status_code == 201:
-            account_info = response.json()
-            test_account = account_info.get('account_number')
-            print(f"   Created test account: {test_account}")
-        else:
-            print("   Failed to create test account")
-            return False
-            
-    except Exception as e:
-        print(f"   Error creating test account: {e}")
-        return False
-    
-    if not test_account:
+    if not accounts:
         print("   No test account available")
         return False
     
+    test_account = accounts[0]
+    
     test_cases = [
         {"account_number": test_account, "amount": 100.50, "expected": 200, "description": "Valid deposit"},
         {"account_number": "9999999999", "amount": 100.50, "expected": 404, "description": "Non-existent account"},
@@ -435,89 +359,36 @@ def test_deposit_validation():
         {"account_number": "invalid", "amount": 100, "expected": 400, "description": "Invalid account number"},
     ]
     
-    success_count = 0
+    results = []
     
     for test_case in test_cases:
         try:
-            response = requests.post(
-                f"{API_BASE}/deposit",
-                headers={"Content-Type": "application/json"},
-                data=json.dumps({
+            response = await client.post(
+                "/deposit",
+                content=dumps({
                     "account_number": test_case["account_number"],
                     "amount": test_case["amount"]
                 })
             )
             
             success = response.status_code == test_case["expected"]
-            
-            if success:
-                success_count += 1
-            else:
-                print(f"   ❌ {test_case['description']}: Expected {test_case['expected']}, got {response.status_code}")
+            detail = "" if success else f"Expected {test_case['expected']}, got {response.status_code}"
+            results.append(CaseResult(test_case["description"], success, detail))
                 
         except Exception as e:
-            print(f"   ❌ {test_case['description']}: Error {e}")
+            results.append(CaseResult(test_case["description"], False, f"Error {e}"))
     
-    print_test_result("Deposit Validation", success_count == len(test_cases), f"{success_count}/{len(test_cases)} tests passed")
-    return success_count == len(test_cases)
+    return _report_cases("Deposit Validation", results)
 
-def test_transfer_validation():
+async def check_transfer_validation(client, accounts):
     """Test transfer validation"""
     print("Testing Transfer Validation...")
     
-    # Create two test accounts
-    test_accounts = []
-    try:
-        for i in range(2):
-            account_data = {
-                "name": f"Test{i}",
-                "surname": "User",
-                "phone": f"+123456789{i}_{int(time.time() * 1000) % 10000}",
-                "password": "SecurePass123!",
-                "date_of_birth": "1990-01-01",
-                "place_of_birth": "Test City"
-            }
-            
-            response = requests.post(
-                f"{API_BASE}/create-account",
-                headers={"Content-Type": "application/json"},
-                data=json.dumps(account_data)
-            )
-            
-            if response.status_code == 201:
-                account_info = response.json()
-                test_accounts.append(account_info.get('account_number'))
-                print(f"   Created test account {i+1}: {test_accounts[-1]}")
-            else:
-                print(f"   Failed to create test account {i+1}")
-                return False
-                
-    except Exception as e:
-        print(f"   Error creating test accounts: {e}")
-        return False
-    
-    if len(test_accounts) != 2:
+    if not accounts:
         print("   Not enough test accounts available")
         return False
     
-    # Deposit some funds to the first account
-    try:
-        response = requests.post(
-            f"{API_BASE}/deposit",
-            headers={"Content-Type": "application/json"},
-            data=json.dumps({
-                "account_number": test_accounts[0],
-                "amount": 1000.00
-            })
-        )
-        
-        if response.status_code != 200:
-            print("   Failed to deposit funds to test account")
-            return False
-            
-    except Exception as e:
-        print(f"   Error depositing funds: {e}")
-        return False
+    test_accounts = list(accounts)
     
     test_cases = [
         {"from_account": test_accounts[0], "to_account": test_accounts[1], "amount": 100.50, "expected": 200, "description": "Valid transfer"},
@@ -532,14 +403,13 @@ def test_transfer_validation():
         {"from_account": "invalid", "to_account": test_accounts[1], "amount": 100, "expected": 400, "description": "Invalid source account"},
     ]
     
-    success_count = 0
+    results = []
     
     for test_case in test_cases:
         try:
-            response = requests.post(
-                f"{API_BASE}/transfer",
-                headers={"Content-Type": "application/json"},
-                data=json.dumps({
+            response = await client.post(
+                "/transfer",
+                content=dumps({
                     "from_account": test_case["from_account"],
                     "to_account": test_case["to_account"],
                     "amount": test_case["amount"]
@@ -547,62 +417,158 @@ def test_transfer_validation():
             )
             
             success = response.status_code == test_case["expected"]
-            
-            if success:
-                success_count += 1
-            else:
-                print(f"   ❌ {test_case['description']}: Expected {test_case['expected']}, got {response.status_code}")
+            detail = "" if success else f"Expected {test_case['expected']}, got {response.status_code}"
+            results.append(CaseResult(test_case["description"], success, detail))
                 
         except Exception as e:
-            print(f"   ❌ {test_case['description']}: Error {e}")
+            results.append(CaseResult(test_case["description"], False, f"Error {e}"))
     
-    print_test_result("Transfer Validation", success_count == len(test_cases), f"{success_count}/{len(test_cases)} tests passed")
-    return success_count == len(test_cases)
+    return _report_cases("Transfer Validation", results)
+
+ErrorCase = namedtuple("ErrorCase", "endpoint method data expected description")
 
-def test_error_handling():
+ERROR_CASES = (
+    ErrorCase("/create-account", "POST", None, 400, "Missing request body"),
+    ErrorCase("/create-account", "POST", {}, 400, "Empty request body"),
+    ErrorCase("/deposit", "POST", None, 400, "Missing deposit data"),
+    ErrorCase("/transfer", "POST", None, 400, "Missing transfer data"),
+    ErrorCase("/validate-phone", "POST", None, 400, "Missing phone data"),
+    ErrorCase("/validate-password", "POST", None, 400, "Missing password data"),
+    ErrorCase("/validate-account", "POST", None, 400, "Missing account data"),
+    ErrorCase("/validate-amount", "POST", None, 400, "Missing amount data"),
+    ErrorCase("/validate-field", "POST", None, 400, "Missing field data"),
+    ErrorCase("/account/9999999999", "GET", None, 400, "Non-existent account"),
+    ErrorCase("/account/9999999999/balance", "GET", None, 400, "Non-existent account balance"),
+    ErrorCase("/account/9999999999/transactions", "GET", None, 400, "Non-existent account transactions"),
+)
+ERROR_BODIES = tuple(None if test_case.data is None else dumps(test_case.data) for test_case in ERROR_CASES)
+
+async def check_error_handling(client):
     """Test error handling scenarios"""
     print("Testing Error Handling...")
     
-    test_cases = [
-        {"endpoint": "/create-account", "method": "POST", "data": None, "expected": 400, "description": "Missing request body"},
-        {"endpoint": "/create-account", "method": "POST", "data": {}, "expected": 400, "description": "Empty request body"},
-        {"endpoint": "/deposit", "method": "POST", "data": None, "expected": 400, "description": "Missing deposit data"},
-        {"endpoint": "/transfer", "method": "POST", "data": None, "expected": 400, "description": "Missing transfer data"},
-        {"endpoint": "/validate-phone", "method": "POST", "data": None, "expected": 400, "description": "Missing phone data"},
-        {"endpoint": "/validate-password", "method": "POST", "data": None, "expected": 400, "description": "Missing password data"},
-        {"endpoint": "/validate-account", "method": "POST", "data": None, "expected": 400, "description": "Missing account data"},
-        {"endpoint": "/validate-amount", "method": "POST", "data": None, "expected": 400, "description": "Missing amount data"},
-        {"endpoint": "/validate-field", "method": "POST", "data": None, "expected": 400, "description": "Missing field data"},
-        {"endpoint": "/account/9999999999", "method": "GET", "data": None, "expected": 400, "description": "Non-existent account"},
-        {"endpoint": "/account/9999999999/balance", "method": "GET", "data": None, "expected": 400, "description": "Non-existent account balance"},
-        {"endpoint": "/account/9999999999/transactions", "method": "GET", "data": None, "expected": 400, "description": "Non-existent account transactions"},
-    ]
+    return await _run_cases(client, "Error Handling", ERROR_CASES, ERROR_BODIES, _check_status)
+
+async def _create_test_account(client, index):
+    """Create one test account; returns its account number or None"""
+    account_data = {
+        "name": f"Test{index}",
+        "surname": "User",
+        "phone": f"+123456789{index}_{next(_PHONE_SEQ) % PHONE_SUFFIX_MOD:04d}",
+        "password": "SecurePass123!",
+        "date_of_birth": "1990-01-01",
+        "place_of_birth": "Test City"
+    }
     
-    success_count = 0
+    try:
+        response = await client.post("/create-account", content=dumps(account_data))
+        
+        if response.status_code == 201:
+            account_number = parse_json(response).get('account_number')
+            print(f"   Created test account {index + 1}: {account_number}")
+            return account_number
+        
+        print(f"   Failed to create test account {index + 1}")
+    except Exception as e:
+        print(f"   Error creating test account {index + 1}: {e}")
+    return None
+
+async def create_funded_accounts(client):
+    """Create the two accounts shared by the deposit and transfer tests and fund the first;
+    returns the (funded, empty) account numbers, or None if setup failed"""
+    print("Setting up shared test accounts...")
     
-    for test_case in test_cases:
-        try:
-            if test_case["method"] == "POST":
-                response = requests.post(
-                    f"{API_BASE}{test_case['endpoint']}",
-                    headers={"Content-Type": "application/json"},
-                    data=json.dumps(test_case["data"]) if test_case["data"] is not None else None
-                )
-            else:
-                response = requests.get(f"{API_BASE}{test_case['endpoint']}")
-            
-            success = response.status_code == test_case["expected"]
+    accounts = await asyncio.gather(*(_create_test_account(client, i) for i in range(2)))
+    if not all(accounts):
+        print()
+        return None
+    
+    # Deposit some funds to the first account
+    try:
+        response = await client.post("/deposit", content=dumps({
+            "account_number": accounts[0],
+            "amount": 1000.00
+        }))
+        
+        if response.status_code != 200:
+            print("   Failed to deposit funds to test account")
+            print()
+            return None
             
-            if success:
-                success_count += 1
-            else:
-                print(f"   ❌ {test_case['description']}: Expected {test_case['expected']}, got {response.status_code}")
-                
+    except Exception as e:
+        print(f"   Error depositing funds: {e}")
+        print()
+        return None
+    
+    print()
+    return tuple(accounts)
+
+# Tests with no shared state, run concurrently
+INDEPENDENT_TESTS = [
+    ("Health Check", check_health),
+    ("Validation Rules", check_validation_rules),
+    ("Phone Validation", check_phone_validation),
+    ("Password Validation", check_password_validation),
+    ("Account Validation", check_account_validation),
+    ("Amount Validation", check_amount_validation),
+    ("Field Validation", check_field_validation),
+    ("Error Handling", check_error_handling),
+]
+
+async def _run_test(test_name, test_func, client):
+    """Run one test with its output captured; returns ((name, result), output)"""
+    with capture_output() as buffer:
+        try:
+            result = await test_func(client)
         except Exception as e:
-            print(f"   ❌ {test_case['description']}: Error {e}")
+            print(f"❌ {test_name}: Test failed with exception: {e}")
+            result = False
+        print()
     
-    print_test_result("Error Handling", success_count == len(test_cases), f"{success_count}/{len(test_cases)} tests passed")
-    return success_count == len(test_cases)
+    return (test_name, result), buffer.getvalue()
+
+async def run_all():
+    """Run all validation and error handling tests over one shared keep-alive client"""
+    # Test results tracking
+    test_results = []
+    
+    async with httpx.AsyncClient(
+        base_url=API_BASE,
+        headers={"Content-Type": "application/json"},
+        transport=RetryTransport(RETRY_TOTAL, RETRY_BACKOFF, limits=CLIENT_LIMITS)
+    ) as client:
+        # Each test's output is buffered and printed in order once it has finished
+        stdout = sys.stdout
+        sys.stdout = BufferedStdout(stdout)
+        try:
+            for result, output in await asyncio.gather(
+                *(_run_test(test_name, test_func, client) for test_name, test_func in INDEPENDENT_TESTS)
+            ):
+                test_results.append(result)
+                stdout.write(output)
+            
+            # The deposit and transfer tests share accounts created once, up front
+            accounts = await create_funded_accounts(client)
+            
+            # Tests that create accounts or move money run one at a time
+            serial_tests = [
+                ("Account Creation Validation", check_account_creation_validation),
+                ("Deposit Validation", partial(check_deposit_validation, accounts=accounts)),
+                ("Transfer Validation", partial(check_transfer_validation, accounts=accounts)),
+            ]
+            for test_name, test_func in serial_tests:
+                result, output = await _run_test(test_name, test_func, client)
+                test_results.append(result)
+                stdout.write(output)
+        finally:
+            sys.stdout = stdout
+    
+    return test_results
+
+def test_validation_and_error_handling():
+    """pytest entry point: run every check through the concurrent runner (needs the server running)"""
+    failed = [test_name for test_name, result in asyncio.run(run_all()) if not result]
+    assert not failed, f"Failed checks: {', '.join(failed)}"
 
 def main():
     """Run all validation and error handling tests"""
@@ -611,32 +577,7 @@ def main():
     print("=" * 60)
     print()
     
-    # Test results tracking
-    test_results = []
-    
-    # Run all tests
-    tests = [
-        ("Health Check", test_health_check),
-        ("Validation Rules", test_validation_rules),
-        ("Phone Validation", test_phone_validation),
-        ("Password Validation", test_password_validation),
-        ("Account Validation", test_account_validation),
-        ("Amount Validation", test_amount_validation),
-        ("Field Validation", test_field_validation),
-        ("Account Creation Validation", test_account_creation_validation),
-        ("Deposit Validation", test_deposit_validation),
-        ("Transfer Validation", test_transfer_validation),
-        ("Error Handling", test_error_handling),
-    ]
-    
-    for test_name, test_func in tests:
-        try:
-            result = test_func()
-            test_results.append((test_name, result))
-        except Exception as e:
-            print(f"❌ {test_name}: Test failed with exception: {e}")
-            test_results.append((test_name, False))
-        print()
+    test_results = asyncio.run(run_all())
     
     # Summary
     print("=" * 60)
@@ -0,0 +1,78 @@
+"""
+Shared helpers for the Bric Pay test scripts
+JSON encoding, per-test output capture and a retrying httpx transport
+"""
+import asyncio
+import contextvars
+import io
+from contextlib import contextmanager
+
+import httpx
+
+# orjson is optional; fall back to the standard library encoder when it is missing
+try:
+    import orjson
+    dumps = orjson.dumps
+    loads = orjson.loads
+except ImportError:
+    import json
+    
+    def dumps(obj):
+        return json.dumps(obj).encode()
+    
+    loads = json.loads
+
+def parse_json(response):
+    """Decode a JSON response body (requests or httpx)"""
+    return loads(response.content)
+
+# Capture buffer of the running test. Each thread and each asyncio task has its own
+# context, so tests running concurrently on either don't interleave their output
+_OUTPUT = contextvars.ContextVar("output", default=None)
+
+class BufferedStdout:
+    """stdout proxy that writes to the current test's capture buffer when one is set"""
+    
+    def __init__(self, stream):
+        self.stream = stream
+    
+    def write(self, text):
+        return (_OUTPUT.get() or self.stream).write(text)
+    
+    def flush(self):
+        self.stream.flush()
+
+@contextmanager
+def capture_output():
+    """Capture what the current thread or task prints while sys.stdout is a BufferedStdout; yields the buffer"""
+    buffer = io.StringIO()
+    token = _OUTPUT.set(buffer)
+    try:
+        yield buffer
+    finally:
+        _OUTPUT.reset(token)
+
+# Gateway errors worth retrying
+RETRY_STATUSES = (502, 503, 504)
+
+class RetryTransport(httpx.AsyncHTTPTransport):
+    """Async transport that retries connection failures, and transient 5xx responses to GETs.
+    POSTs are not retried on a status code, since replaying one could create an account
+    or move money twice"""
+    
+    def __init__(self, retries: int, backoff: float, **kwargs):
+        super().__init__(retries=retries, **kwargs)
+        self.max_retries = retries
+        self.backoff = backoff
+    
+    async def handle_async_request(self, request):
+        if request.method != "GET":
+            return await super().handle_async_request(request)
+        
+        for attempt in range(self.max_retries):
+            response = await super().handle_async_request(request)
+            if response.status_code not in RETRY_STATUSES:
+                return response
+            await response.aclose()
+            await asyncio.sleep(self.backoff * (2 ** attempt))
+        return await super().handle_async_request(request)